@@ -0,0 +1,163 @@
+import numpy as np
+from scipy.linalg import eigh_tridiagonal
+from scipy.sparse import issparse
+from scipy.sparse.linalg import aslinearoperator
+from scipy.special import jv
+
+"""
+chebyshev_propagator.py — Phases 6/7/9 Support: Chebyshev Long-Time Evolution
+With H' = (H - b)/a mapped into [-1, 1] (a, b from Lanczos spectral bounds),
+    e^{-iHt} = e^{-ibt} Σ_k (2 - δ_k0) (-i)^k J_k(a t) T_k(H'),
+and T_{k+1} = 2H'T_k - T_{k-1}. J_k(at) decays super-exponentially once k > at, so the
+order is picked per step as the first k beyond which |J_k| < tol: cost grows linearly
+in t, and a whole interval is taken in one expansion (no step-size error to accumulate).
+Lanczos bounds are estimates: if part of the spectrum falls outside them the series
+diverges. On [-1, 1] |T_k| <= 1, so ||T_K(H') ψ|| <= ||ψ|| for the last order K unless the
+spectrum leaks out (where T_K grows like cosh(K acosh|x|)). Each step checks this; on
+failure it redoes the step with the Gershgorin enclosure (always valid), or raises when
+H offers none.
+"""
+
+def lanczos_bounds(H, n_steps=30, seed=0):
+    """
+    (E_min, E_max) enclosing spec(H): extreme Ritz values widened by their residuals β|s_m|.
+    """
+    H = aslinearoperator(H)
+    dim = H.shape[0]
+    m = min(n_steps, dim)
+    rng = np.random.default_rng(seed)
+    v = rng.normal(size=dim) + 1j * rng.normal(size=dim)
+    V = np.empty((m, dim), dtype=complex)
+    V[0] = v / np.linalg.norm(v)
+    alpha, beta = [], []
+    b = 0.0
+    for j in range(m):
+        w = H.matvec(V[j])
+        alpha.append(np.vdot(V[j], w).real)
+        w = w - V[:j + 1].T @ (V[:j + 1].conj() @ w)
+        b = np.linalg.norm(w)
+        if b < 1e-12 or j + 1 == m:
+            break
+        beta.append(b)
+        V[j + 1] = w / b
+    if len(alpha) == 1:
+        theta, s = np.array(alpha), np.ones((1, 1))
+    else:
+        theta, s = eigh_tridiagonal(np.array(alpha), np.array(beta))
+    lo = theta[0] - b * abs(s[-1, 0])
+    hi = theta[-1] + b * abs(s[-1, -1])
+    return lo, hi
+
+def gershgorin_bounds(H):
+    """
+    Rigorous (E_min, E_max) from Gershgorin discs, or None if H exposes no matrix entries.
+    """
+    if hasattr(H, 'gershgorin_bounds'):
+        return H.gershgorin_bounds()
+    if issparse(H):
+        diag = np.real(H.diagonal())
+        off = np.asarray(abs(H).sum(axis=1)).ravel() - np.abs(diag)
+        return np.min(diag - off), np.max(diag + off)
+    return None
+
+class ChebyshevPropagator:
+    """
+    e^{-iHt} on (dim, n_states) blocks. H: sparse matrix or LinearOperator (Hermitian).
+    bounds: optional (E_min, E_max); otherwise estimated by lanczos_bounds and padded by margin,
+    never beyond the Gershgorin enclosure. growth_tol: allowed ||T_K ψ|| / ||ψ|| - 1 per step.
+    Counters: n_matvec (block products), max_order, n_widened (steps redone with Gershgorin).
+    """
+    def __init__(self, H, bounds=None, tol=1e-14, margin=0.01, n_lanczos=30, growth_tol=1e-6):
+        self.H = aslinearoperator(H)
+        self.dim = H.shape[0]
+        self.tol = tol
+        self.growth_tol = growth_tol
+        self.enclosure = gershgorin_bounds(H)
+        lo, hi = bounds if bounds is not None else lanczos_bounds(H, n_lanczos)
+        pad = margin * (hi - lo) + 1e-12
+        lo, hi = lo - pad, hi + pad
+        if self.enclosure is not None:
+            lo, hi = max(lo, self.enclosure[0]), min(hi, self.enclosure[1])
+        self._set_interval(lo, hi)
+        self.rigorous = False
+        self.n_matvec = 0
+        self.max_order = 0
+        self.n_widened = 0
+
+    def _set_interval(self, lo, hi):
+        self.a = (hi - lo) / 2 + 1e-12
+        self.b = (hi + lo) / 2
+
+    def coefficients(self, dt):
+        """
+        (2 - δ_k0) (-i)^k J_k(a dt), truncated once the Bessel tail drops below tol.
+        """
+        x = self.a * abs(dt)
+        k_max = int(x + 10 * np.cbrt(x) + 40)
+        J = jv(np.arange(k_max + 1), x)
+        above = np.nonzero(np.abs(J) > self.tol / 4)[0]
+        order = above[-1] + 1 if above.size else 1
+        k = np.arange(order + 1)
+        c = (2.0 - (k == 0)) * (-1j * np.sign(dt)) ** k * J[:order + 1]
+        return c
+
+    def _apply_scaled(self, X):
+        self.n_matvec += 1
+        return (self.H.matmat(X) - self.b * X) / self.a
+
+    def step(self, block, dt):
+        """
+        e^{-iH dt} applied to a (dim, n_states) block in one Chebyshev expansion.
+        Raises RuntimeError if T_K grows past growth_tol even with rigorous bounds.
+        """
+        if dt == 0.0:
+            return block
+        out, growth = self._expand(block, dt)
+        if growth > 1.0 + self.growth_tol:
+            if self.enclosure is None or self.rigorous:
+                raise RuntimeError(f"Chebyshev series diverged (||T_K ψ|| / ||ψ|| = {growth:.3g}): "
+                                   "spectral bounds do not enclose spec(H)")
+            # Spectrum leaks outside the estimated interval: fall back to the enclosure
+            self._set_interval(*self.enclosure)
+            self.rigorous = True
+            self.n_widened += 1
+            return self.step(block, dt)
+        return out
+
+    def _expand(self, block, dt):
+        c = self.coefficients(dt)
+        self.max_order = max(self.max_order, len(c) - 1)
+        T_prev = block
+        out = c[0] * T_prev
+        if len(c) > 1:
+            T_curr = self._apply_scaled(block)
+            out = out + c[1] * T_curr
+            for ck in c[2:]:
+                T_prev, T_curr = T_curr, 2.0 * self._apply_scaled(T_curr) - T_prev
+                out = out + ck * T_curr
+        else:
+            T_curr = block
+        norms = np.linalg.norm(block, axis=0)
+        growth = np.max(np.linalg.norm(T_curr, axis=0) / np.maximum(norms, 1e-300))
+        return np.exp(-1j * self.b * dt) * out, growth
+
+    def iter_evolve(self, states, times):
+        """
+        Yields (t, block(t)) along times (increasing, starting at or after 0).
+        states: list of state tensors or a (dim, n) array.
+        """
+        if isinstance(states, np.ndarray) and states.ndim == 2 and states.shape[0] == self.dim:
+            block = states.astype(complex)
+        else:
+            block = np.column_stack([np.asarray(s).reshape(-1) for s in states]).astype(complex)
+        t_prev = 0.0
+        for t in times:
+            block = self.step(block, t - t_prev)
+            t_prev = t
+            yield t, block
+
+    def evolve(self, states, times):
+        """
+        Array (n_times, dim, n_states) of evolved states; prefer iter_evolve for large L.
+        """
+        return np.array([block for _, block in self.iter_evolve(states, times)])
@@ -0,0 +1,103 @@
+import numpy as np
+from scipy.sparse.linalg import eigsh, lobpcg, aslinearoperator, LinearOperator
+
+"""
+continuation_solver.py — Phase 9 Support: Warm-Started Eigensolver Along Parameter Paths
+Each point of a sweep seeds eigsh (v0) or LOBPCG (X) with the previous eigenvectors.
+Fidelity F = |<ψ(λ_i)|ψ(λ_{i+1})>| and χ_F ≈ 2(1 - F)/dλ² come out as a by-product.
+"""
+
+class _CountingOperator(LinearOperator):
+    """
+    Wraps H and counts applied vectors, the iteration cost reported per point.
+    """
+    def __init__(self, H):
+        self.op = aslinearoperator(H)
+        self.n_matvec = 0
+        super().__init__(dtype=self.op.dtype, shape=self.op.shape)
+
+    def _matvec(self, x):
+        self.n_matvec += 1
+        return self.op.matvec(x)
+
+    def _matmat(self, X):
+        self.n_matvec += X.shape[1]
+        return self.op.matmat(X)
+
+    def _rmatvec(self, x):
+        return self._matvec(x)
+
+    def _adjoint(self):
+        return self
+
+class ContinuationSolver:
+    """
+    Lowest-k eigenpairs of sparse / matrix-free H, warm-started from a guess.
+    method: 'eigsh' (ARPACK, v0 = first guess vector) or 'lobpcg' (block guess).
+    """
+    def __init__(self, k=1, method='eigsh', tol=1e-12, maxiter=None, warm=True, seed=0):
+        assert method in ('eigsh', 'lobpcg'), f"Unknown method: {method}"
+        self.k = k
+        self.method = method
+        self.tol = tol
+        self.maxiter = maxiter
+        self.warm = warm
+        self.rng = np.random.default_rng(seed)
+
+    def _block_guess(self, n, dtype, guess):
+        X = self.rng.standard_normal((n, self.k)).astype(dtype)
+        if guess is not None:
+            m = min(self.k, guess.shape[1])
+            X[:, :m] = guess[:, :m]
+        return X
+
+    def solve(self, H, guess=None):
+        """
+        Returns (eigvals, eigvecs, n_matvec). guess: (dim,) or (dim, m) array or None.
+        """
+        op = _CountingOperator(H)
+        n = op.shape[0]
+        if guess is not None:
+            guess = np.asarray(guess).reshape(n, -1)
+        if self.method == 'eigsh':
+            v0 = None if guess is None else guess[:, 0]
+            w, v = eigsh(op, k=self.k, which='SA', v0=v0, tol=self.tol, maxiter=self.maxiter)
+        else:
+            dtype = np.result_type(op.dtype, guess.dtype if guess is not None else np.float64)
+            X = self._block_guess(n, dtype, guess)
+            w, v = lobpcg(op, X, largest=False, tol=self.tol, maxiter=self.maxiter or 500)
+        order = np.argsort(w)
+        return w[order], v[:, order], op.n_matvec
+
+    def sweep(self, build_H, values):
+        """
+        Solve along values, seeding each point with the previous eigenvectors.
+        build_H(value) -> sparse matrix or LinearOperator.
+        Returns a dict of arrays: values, eigvals (n, k), ground (n, dim), matvecs,
+        fidelity and chi_F (both NaN at the first point).
+        """
+        values = np.asarray(values, dtype=float)
+        eigvals, ground, matvecs, fidelity, chi_F = [], [], [], [], []
+        prev = None
+        for i, lam in enumerate(values):
+            w, v, n_mv = self.solve(build_H(lam), prev if self.warm else None)
+            if prev is None:
+                F, chi = np.nan, np.nan
+            else:
+                F = abs(np.vdot(prev[:, 0], v[:, 0]))
+                d_lam = lam - values[i - 1]
+                chi = 2.0 * (1.0 - F) / d_lam**2
+            prev = v
+            eigvals.append(w)
+            ground.append(v[:, 0])
+            matvecs.append(n_mv)
+            fidelity.append(F)
+            chi_F.append(chi)
+        return {
+            'values': values,
+            'eigvals': np.array(eigvals),
+            'ground': np.array(ground),
+            'matvecs': np.array(matvecs),
+            'fidelity': np.array(fidelity),
+            'chi_F': np.array(chi_F),
+        }
@@ -0,0 +1,87 @@
+import numpy as np
+from itertools import takewhile
+from scipy.optimize import brentq, minimize_scalar
+
+"""
+crossing_search.py — Phases 7/9 Support: Adaptive Threshold-Crossing Times
+τ = first t in [0, t_max] where f(t) rises above a threshold (χ_rel for τ_add, τ_onset, τ_break).
+A coarse scan brackets the first crossing of every threshold, stopping as soon as the last
+one is bracketed; Brent's method then refines each bracket to xtol. f is memoised, so
+several thresholds share evaluations and n_evals counts distinct times only.
+Narrow excursions (χ_rel spikes where the δS_A + δS_B denominator passes through zero)
+can fall between coarse points: with refine_peaks, each interior local maximum of the
+coarse samples ahead of a threshold's first crossing is maximized to xtol first.
+"""
+
+class CrossingSearch:
+    """
+    f: t -> scalar, typically jumping a propagator straight to t.
+    """
+    def __init__(self, f, t_max, n_coarse=8, xtol=1e-2, refine_peaks=True):
+        self.f = f
+        self.t_max = t_max
+        self.n_coarse = n_coarse
+        self.xtol = xtol
+        self.refine_peaks = refine_peaks
+        self.values = {}
+
+    def __call__(self, t):
+        t = float(t)
+        if t not in self.values:
+            self.values[t] = self.f(t)
+        return self.values[t]
+
+    @property
+    def n_evals(self):
+        return len(self.values)
+
+    def brackets(self, thresholds):
+        """
+        {threshold: (t_lo, t_hi) or None}; t_lo == t_hi when f(0) is already above.
+        """
+        found = {thr: None for thr in thresholds}
+        samples = []
+        t_prev = None
+        for t in np.linspace(0.0, self.t_max, self.n_coarse):
+            value = self(t)
+            samples.append(float(t))
+            for thr in thresholds:
+                if found[thr] is None and value > thr:
+                    found[thr] = (t, t) if t_prev is None else (t_prev, t)
+            if all(b is not None for b in found.values()):
+                break
+            t_prev = t
+        if self.refine_peaks:
+            for thr in thresholds:
+                if found[thr] is None or found[thr][0] != found[thr][1]:
+                    found[thr] = self._peak_bracket(samples, thr) or found[thr]
+        return found
+
+    def _peak_bracket(self, samples, thr):
+        """
+        (t_lo, t_peak) of the first coarse local maximum whose refined peak exceeds thr,
+        among the samples ahead of the first coarse crossing; None if there is none.
+        """
+        below = list(takewhile(lambda t: self(t) <= thr, samples))
+        for t_lo, t_mid, t_hi in zip(below, below[1:], below[2:]):
+            if self(t_mid) > self(t_lo) and self(t_mid) > self(t_hi):
+                res = minimize_scalar(lambda t: -self(t), bounds=(t_lo, t_hi), method='bounded',
+                                      options={'xatol': self.xtol})
+                t_peak = min((t_mid, float(res.x)), key=lambda t: -self(t))
+                if self(t_peak) > thr:
+                    return (t_lo, t_peak)
+        return None
+
+    def scan(self, thresholds):
+        """
+        {threshold: τ or None (no crossing up to t_max)}.
+        """
+        taus = {}
+        for thr, bracket in self.brackets(thresholds).items():
+            if bracket is None:
+                taus[thr] = None
+            elif bracket[0] == bracket[1]:
+                taus[thr] = bracket[0]
+            else:
+                taus[thr] = brentq(lambda t: self(t) - thr, *bracket, xtol=self.xtol)
+        return taus
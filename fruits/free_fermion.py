@@ -0,0 +1,193 @@
+import numpy as np
+
+"""
+free_fermion.py — Phases 2/3 Support: Gaussian (Free-Fermion) Backend for the TFIM
+H = -Σ Z_i Z_{i+1} - Σ h_i X_i maps, via Jordan-Wigner with X strings,
+    γ_{2j} = (Π_{k<j} X_k) Z_j,   γ_{2j+1} = (Π_{k<j} X_k) Y_j,
+onto H = (i/4) γ^T A γ with A real antisymmetric (2L x 2L). The ground state lies in the
+even-parity sector (Π X = +1), where the periodic bond picks up the antiperiodic sign.
+Everything below works with the real antisymmetric correlation matrix
+    Γ_ab = (i/2) <[γ_a, γ_b]>,
+and contiguous spin blocks [m, m+ℓ) correspond to the Majorana block [2m, 2m+2ℓ).
+Quenches stay Gaussian: dγ/dt = A γ, so Γ(t) = R Γ R^T with R(t) = e^{At} orthogonal.
+"""
+
+def majorana_hamiltonian(L, h=1.0, J=1.0, fields=None, periodic=True):
+    """
+    A such that H = (i/4) γ^T A γ. fields: optional per-site h_i (overrides h).
+    """
+    h_sites = np.full(L, float(h)) if fields is None else np.asarray(fields, dtype=float)
+    A = np.zeros((2 * L, 2 * L))
+    # -h X_j = -h i γ_{2j} γ_{2j+1}
+    for j in range(L):
+        A[2*j, 2*j+1] += -2.0 * h_sites[j]
+    # -J Z_j Z_{j+1} = -J i γ_{2j+1} γ_{2j+2}
+    for j in range(L - 1):
+        A[2*j+1, 2*j+2] += -2.0 * J
+    if periodic:
+        # -J Z_{L-1} Z_0 = +J i P γ_{2L-1} γ_0 with P = +1 in the ground-state sector
+        A[2*L-1, 0] += 2.0 * J
+    return A - A.T
+
+def ground_state_correlations(A):
+    """
+    Γ = -A (A^T A)^{-1/2}, i.e. iΓ = -sign(iA): all negative-energy modes filled.
+    """
+    lam, U = np.linalg.eigh(A.T @ A)
+    if lam.min() < 1e-20:
+        raise ValueError("Majorana Hamiltonian has a zero mode; ground state is degenerate")
+    return -A @ (U * (1.0 / np.sqrt(lam))) @ U.T
+
+def block_indices(sites):
+    sites = np.asarray(sorted(sites))
+    return np.ravel(np.column_stack([2 * sites, 2 * sites + 1]))
+
+def _nu(Gamma_sub):
+    # Eigenvalues of iΓ come in ±ν; -Γ^2 = Γ^T Γ has each ν² twice
+    nu2 = np.linalg.eigvalsh(-Gamma_sub @ Gamma_sub)
+    return np.sqrt(np.clip(nu2, 0.0, 1.0))
+
+def _binary_entropy(nu):
+    p = np.clip((1.0 + nu) / 2.0, 1e-300, 1.0)
+    q = np.clip((1.0 - nu) / 2.0, 1e-300, 1.0)
+    return -p * np.log(p) - q * np.log(q)
+
+def gaussian_entropy(Gamma, sites):
+    """
+    Von Neumann entropy (nats) of a contiguous spin block from its Majorana sub-block.
+    """
+    sites = sorted(sites)
+    assert sites == list(range(sites[0], sites[-1] + 1)), "spin/fermion entropies agree only for contiguous blocks"
+    idx = block_indices(sites)
+    # Each ν appears twice in the spectrum of -Γ^2
+    return 0.5 * np.sum(_binary_entropy(_nu(Gamma[np.ix_(idx, idx)])))
+
+def gaussian_entropy_profile(Gamma, ells, start=0):
+    """
+    S(ℓ) of the blocks [start, start+ℓ) for every ℓ in ells.
+    """
+    return np.array([gaussian_entropy(Gamma, list(range(start, start + l))) for l in ells])
+
+def gaussian_mutual_info(Gamma, sites_a, sites_b):
+    """
+    Spin I(A:B) = S_A + S_B - S_AB for adjacent contiguous blocks. Separated blocks are
+    rejected: the Jordan-Wigner string between them makes the union's spin entropy differ
+    from the fermionic one that Γ gives (L=8, [0] vs [2]: 0.045 fermionic, 0.262 spin).
+    """
+    union = sorted(list(sites_a) + list(sites_b))
+    assert union == list(range(union[0], union[-1] + 1)), "spin mutual information needs A ∪ B contiguous"
+    return gaussian_entropy(Gamma, sites_a) + gaussian_entropy(Gamma, sites_b) - gaussian_entropy(Gamma, union)
+
+def gaussian_relative_entropy(Gamma_rho, Gamma_sigma, sites, clip=1e-12):
+    """
+    D(ρ_A || σ_A) for Gaussian states, from Majorana sub-blocks of Γ_ρ and Γ_σ.
+    With G = iΓ and modular generator K_σ = -2 artanh(G_σ):
+        Tr ρ ln σ = -(1/4) Tr(K_σ G_ρ) - (1/2) Σ_λ ln(2 cosh(λ/2)),  λ ∈ spec(K_σ).
+    """
+    idx = block_indices(sites)
+    G_rho = 1j * Gamma_rho[np.ix_(idx, idx)]
+    G_sig = 1j * Gamma_sigma[np.ix_(idx, idx)]
+    g, V = np.linalg.eigh(G_sig)
+    g = np.clip(g, -1.0 + clip, 1.0 - clip)
+    lam = -2.0 * np.arctanh(g)
+    K_sig = (V * lam) @ V.conj().T
+    tr_rho_ln_sigma = -0.25 * np.real(np.trace(K_sig @ G_rho)) - 0.5 * np.sum(np.logaddexp(lam / 2, -lam / 2))
+    s_rho = 0.5 * np.sum(_binary_entropy(_nu(Gamma_rho[np.ix_(idx, idx)])))
+    return -s_rho - tr_rho_ln_sigma
+
+class GaussianTFIM:
+    """
+    Correlation-matrix ground state of the periodic TFIM with optional local field deformations.
+    sites_deltas: list of (site, δh) pairs added to h at those sites (H - δh X_site).
+    """
+    def __init__(self, L, h=1.0, J=1.0, sites_deltas=()):
+        self.L = L
+        fields = np.full(L, float(h))
+        for site, dh in sites_deltas:
+            fields[site] += dh
+        self.A = majorana_hamiltonian(L, J=J, fields=fields)
+        self.Gamma = ground_state_correlations(self.A)
+
+    def entropy(self, sites):
+        return gaussian_entropy(self.Gamma, sites)
+
+    def entropy_profile(self, ells=None, start=0):
+        if ells is None:
+            ells = range(1, self.L)
+        return gaussian_entropy_profile(self.Gamma, ells, start)
+
+    def mutual_info(self, sites_a, sites_b):
+        return gaussian_mutual_info(self.Gamma, sites_a, sites_b)
+
+    def relative_entropy(self, reference, sites):
+        return gaussian_relative_entropy(self.Gamma, reference.Gamma, sites)
+
+class GaussianState:
+    """
+    Γ(t) = R(t) Γ0 R(t)^T for a GaussianQuench (or Γ0 itself when quench is None).
+    Blocks are formed from the rows of R on the block only: O(ℓ L^2) per entropy.
+    """
+    def __init__(self, Gamma0, quench=None, t=0.0):
+        self.Gamma0 = Gamma0
+        self.quench = quench
+        self.t = t
+        self.L = Gamma0.shape[0] // 2
+
+    def block(self, idx):
+        if self.quench is None:
+            return self.Gamma0[np.ix_(idx, idx)]
+        R = self.quench.rows(idx, self.t)
+        return R @ self.Gamma0 @ R.T
+
+    @property
+    def Gamma(self):
+        return self.block(np.arange(2 * self.L))
+
+    def entropy(self, sites):
+        sites = sorted(sites)
+        assert sites == list(range(sites[0], sites[-1] + 1)), "spin/fermion entropies agree only for contiguous blocks"
+        return 0.5 * np.sum(_binary_entropy(_nu(self.block(block_indices(sites)))))
+
+    def energy(self, A):
+        # <(i/4) γ^T A γ> = (1/4) Σ A_ab Γ_ab
+        return 0.25 * np.sum(A * self.Gamma)
+
+    def energy_variance(self, A):
+        # Wick: Var H = (1/8) [Tr(A^T A) - Tr(AΓAΓ)]
+        AG = A @ self.Gamma
+        return 0.125 * (np.sum(A * A) - np.trace(AG @ AG))
+
+class GaussianQuench:
+    """
+    Evolution of Gaussian states under H = (i/4) γ^T A γ from one eigendecomposition
+    iA = U diag(ε) U^†, so that R(t) = e^{At} = U e^{-iεt} U^†.
+    evolve_grid mirrors TimeEvolver: yields (t, [GaussianState]) for Γ0 matrices or states.
+    """
+    def __init__(self, A):
+        self.A = A
+        self.eps, self.U = np.linalg.eigh(1j * A)
+
+    def rows(self, idx, t):
+        """
+        Rows idx of R(t), real orthogonal.
+        """
+        return np.real((self.U[idx] * np.exp(-1j * self.eps * t)) @ self.U.conj().T)
+
+    def propagator(self, t):
+        return self.rows(np.arange(self.A.shape[0]), t)
+
+    def evolve_grid(self, states, times):
+        Gammas = [s.Gamma if isinstance(s, GaussianState) else s for s in states]
+        for t in times:
+            yield t, [GaussianState(G, self, t) for G in Gammas]
+
+def validate_central_charge_gaussian(L=1000, h=1.0, n_points=32):
+    """
+    Refinement 1 at large L: fit S(ℓ) = (c/3) log(chord) + const on ~n_points block sizes.
+    """
+    state = GaussianTFIM(L, h=h)
+    ells = np.unique(np.geomspace(1, L // 2, n_points).astype(int))
+    entropies = state.entropy_profile(ells)
+    log_chords = np.log((L / np.pi) * np.sin(np.pi * ells / L))
+    slope, _ = np.polyfit(log_chords, entropies, 1)
+    return slope * 3, ells, entropies
@@ -0,0 +1,126 @@
+import numpy as np
+from scipy.sparse.linalg import expm_multiply, LinearOperator, aslinearoperator
+
+"""
+krylov_propagator.py — Phases 6/7 Support: Sparse Time Evolution Over Time Grids
+Applies e^{-iHt} to a block of states without ever forming a 2^L x 2^L propagator.
+The grid is walked interval by interval, so only the current block is held in memory.
+    method='expm_multiply': Al-Mohy & Higham truncated Taylor (double-precision target)
+    method='lanczos':       block Krylov over all K states at once (one sparse H @ block
+                            product per step), substeps halved until the error estimate
+                            ||B_m [e^{-iT dt}]_{m,0} R_0|| is below tol
+"""
+
+class KrylovPropagator:
+    """
+    e^{-iHt} on blocks of states. H: sparse matrix or LinearOperator (Hermitian).
+    Block Lanczos keeps up to m_max blocks of K vectors (K * m_max * dim complex entries).
+    Counters: n_matvec (Lanczos only, vectors), max_err (largest accepted Lanczos error estimate).
+    """
+    def __init__(self, H, method='expm_multiply', tol=1e-12, m_max=40):
+        assert method in ('expm_multiply', 'lanczos'), f"Unknown method: {method}"
+        self.H = H
+        self.method = method
+        self.tol = tol
+        self.m_max = m_max
+        self.dim = H.shape[0]
+        if isinstance(H, LinearOperator):
+            # expm_multiply cannot read the trace off an operator; it only sets the shift
+            self.trace = H.trace() if hasattr(H, 'trace') else 0.0
+        else:
+            self.trace = H.diagonal().sum()
+        self.n_matvec = 0
+        self.max_err = 0.0
+
+    def _expm_step(self, block, dt):
+        A = -1j * dt * self.H
+        return expm_multiply(A, block, traceA=-1j * dt * self.trace)
+
+    def _lanczos(self, X, dt):
+        """
+        One block Krylov step of a (dim, K) block; returns (e^{-iH dt} X, error estimate)
+        or (None, err) if m_max blocks do not reach tol.
+        """
+        H = aslinearoperator(self.H)
+        dim, K = X.shape
+        if not np.any(X):
+            return X.copy(), 0.0
+        # X = V_0 R_0;  H V_j = V_{j-1} B_{j-1}^† + V_j A_j + V_{j+1} B_j
+        # Basis stored as rows (V^T) so the growing basis is a contiguous slice;
+        # V^† W is formed as conj(V^T conj(W)) to avoid copying the conjugated basis
+        V = np.empty((self.m_max * K, dim), dtype=np.result_type(X.dtype, complex))
+        Q, R0 = np.linalg.qr(X)
+        V[:K] = Q.T
+        T = np.zeros((self.m_max * K, self.m_max * K), dtype=complex)
+        for j in range(self.m_max):
+            cur, m = slice(j * K, (j + 1) * K), (j + 1) * K
+            basis = V[:m]
+            W = H.matmat(V[cur].T)
+            self.n_matvec += K
+            A = (V[cur] @ W.conj()).conj()
+            T[cur, cur] = (A + A.conj().T) / 2
+            # Block three-term recurrence, re-applied once against the last two blocks
+            local = V[max(0, j - 1) * K:m]
+            for _ in range(2):
+                W = W - local.T @ (local @ W.conj()).conj()
+            Q, B = np.linalg.qr(W)
+            if np.min(np.abs(np.diag(B))) < 1e-8 * max(np.abs(B).max(), 1e-300):
+                # Columns of Q from a rank-deficient W are arbitrary: orthogonalize them too
+                Q, R = np.linalg.qr(Q - basis.T @ (basis @ Q.conj()).conj())
+                B = R @ B
+            evals, evecs = np.linalg.eigh(T[:m, :m])
+            C = evecs @ (np.exp(-1j * dt * evals)[:, None] * evecs[:K].conj().T) @ R0
+            err = np.linalg.norm(B @ C[-K:])
+            if err < self.tol or np.linalg.norm(B) < 1e-14:
+                return basis.T @ C, err
+            if j + 1 < self.m_max:
+                nxt = slice(m, m + K)
+                V[nxt] = Q.T
+                T[nxt, cur] = B
+                T[cur, nxt] = B.conj().T
+        return None, err
+
+    def _lanczos_step(self, block, dt):
+        # Halve a substep until its Krylov estimate passes
+        result = block
+        steps = [dt]
+        while steps:
+            h = steps.pop(0)
+            new, err = self._lanczos(result, h)
+            if new is None:
+                steps = [h / 2, h / 2] + steps
+                continue
+            self.max_err = max(self.max_err, err)
+            result = new
+        return result
+
+    def step(self, block, dt):
+        """
+        e^{-iH dt} applied to a (dim, n_states) block.
+        """
+        if dt == 0.0:
+            return block
+        if self.method == 'expm_multiply':
+            return self._expm_step(block, dt)
+        return self._lanczos_step(block, dt)
+
+    def iter_evolve(self, states, times):
+        """
+        Yields (t, block(t)) along times (increasing, starting at or after 0).
+        states: list of state tensors or a (dim, n) array.
+        """
+        if isinstance(states, np.ndarray) and states.ndim == 2 and states.shape[0] == self.dim:
+            block = states.astype(complex)
+        else:
+            block = np.column_stack([np.asarray(s).reshape(-1) for s in states]).astype(complex)
+        t_prev = 0.0
+        for t in times:
+            block = self.step(block, t - t_prev)
+            t_prev = t
+            yield t, block
+
+    def evolve(self, states, times):
+        """
+        Array (n_times, dim, n_states) of evolved states; prefer iter_evolve for large L.
+        """
+        return np.array([block for _, block in self.iter_evolve(states, times)])
@@ -0,0 +1,126 @@
+import numpy as np
+from scipy.sparse.linalg import cg, eigsh, LinearOperator, aslinearoperator
+
+"""
+linear_response.py — Phases 4-10 Support: Perturbative Deformed Ground States
+H(δ) = H - Σ_i δ_i X_i is expanded around the ground state of H (Rayleigh-Schrödinger):
+    ψ1 = R V ψ0,   ψ2 = R (V - <V>) ψ1,   R = Q (E0 - H)^{-1} Q
+with R applied either by sum-over-states (one full eigendecomposition) or by a
+Sternheimer linear solve (ground state + sparse H only). V is linear in δ, so one
+response vector per site and one per site pair serve every deformation set.
+"""
+
+def _apply_x(vec, site, L):
+    # X on one site flips that bit of the basis index
+    return vec.reshape(2**site, 2, 2**(L - site - 1))[:, ::-1, :].reshape(-1)
+
+class LinearResponseEngine:
+    """
+    First/second-order deformed ground states from a single spectral decomposition.
+    method='sos': needs (w, v) of H. method='sternheimer': needs sparse H; CG solves on Q(H - E0)Q.
+    deformed_state returns the state and an error estimate ||last order|| * Σ|δ| / gap.
+    """
+    def __init__(self, H, w=None, v=None, order=2, method='sos', tol=1e-12, degeneracy_tol=1e-10):
+        assert order in (1, 2), "order must be 1 or 2"
+        assert method in ('sos', 'sternheimer'), f"Unknown method: {method}"
+        self.H = H
+        self.order = order
+        self.method = method
+        self.tol = tol
+        dim = H.shape[0]
+        self.L = int(np.round(np.log2(dim)))
+        if method == 'sos':
+            if w is None or v is None:
+                w, v = np.linalg.eigh(H.toarray())
+            self.w = np.asarray(w)
+            self.v = np.asarray(v)
+            E0, E1 = self.w[0], self.w[1]
+            psi0 = self.v[:, 0]
+        else:
+            w2, v2 = eigsh(H, k=2, which='SA', tol=tol)
+            order_idx = np.argsort(w2)
+            E0, E1 = w2[order_idx[0]], w2[order_idx[1]]
+            psi0 = v2[:, order_idx[0]]
+        if E1 - E0 < degeneracy_tol:
+            raise ValueError("Ground state is degenerate; perturbation theory is ill-defined")
+        self.E0 = E0
+        self.gap = E1 - E0
+        self.psi0 = psi0
+        self._first = {}
+        self._second = {}
+        self.n_solves = 0
+
+    def _project_out(self, x):
+        return x - self.psi0 * np.vdot(self.psi0, x)
+
+    def _resolvent(self, x):
+        """
+        R x = Q (E0 - H)^{-1} Q x.
+        """
+        self.n_solves += 1
+        if self.method == 'sos':
+            c = self.v.conj().T @ x
+            denom = self.E0 - self.w
+            c[1:] /= denom[1:]
+            c[0] = 0.0
+            return self.v @ c
+        H_op = aslinearoperator(self.H)
+        E0 = self.E0
+        shifted = LinearOperator(self.H.shape, dtype=np.result_type(self.H.dtype, x.dtype),
+                                 matvec=lambda y: self._project_out(H_op.matvec(y) - E0 * y))
+        b = self._project_out(x)
+        y, info = cg(shifted, b, rtol=self.tol, atol=0.0, maxiter=10 * self.H.shape[0])
+        if info != 0:
+            raise RuntimeError(f"Sternheimer solve did not converge (info={info})")
+        return -self._project_out(y)
+
+    def _v_site(self, x, site):
+        # V_i = -X_i (unit deformation strength)
+        return -_apply_x(x, site, self.L)
+
+    def first_order(self, site):
+        if site not in self._first:
+            self._first[site] = self._resolvent(self._v_site(self.psi0, site))
+        return self._first[site]
+
+    def second_order(self, i, j):
+        """
+        Bilinear term b_ij = R (V_i - <V_i>) a_j; ψ2 = Σ_ij δ_i δ_j b_ij.
+        """
+        if (i, j) not in self._second:
+            a_j = self.first_order(j)
+            e1_i = np.vdot(self.psi0, self._v_site(self.psi0, i))
+            self._second[(i, j)] = self._resolvent(self._v_site(a_j, i) - e1_i * a_j)
+        return self._second[(i, j)]
+
+    def deformed_state(self, sites_deltas):
+        """
+        Perturbed ground state of H - Σ δ X_site, shaped (2,)*L, plus an error estimate.
+        """
+        psi1 = sum(d * self.first_order(s) for s, d in sites_deltas)
+        psi = self.psi0 + psi1
+        last = psi1
+        if self.order == 2:
+            psi2 = sum(di * dj * self.second_order(si, sj)
+                       for si, di in sites_deltas for sj, dj in sites_deltas)
+            psi = psi + psi2
+            last = psi2
+        psi = psi / np.linalg.norm(psi)
+        strength = sum(abs(d) for _, d in sites_deltas)
+        err_est = np.linalg.norm(last) * strength / self.gap
+        return psi.reshape(*(2 for _ in range(self.L))), err_est
+
+    def compare_exact(self, sites_deltas):
+        """
+        Error of the perturbative state against a dense exact solve of H - Σ δ X_site.
+        Returns {'infidelity', 'estimate'}.
+        """
+        H_mod = self.H.toarray().astype(np.result_type(self.H.dtype, np.float64))
+        dim = H_mod.shape[0]
+        for site, d in sites_deltas:
+            idx = np.arange(dim)
+            H_mod[idx ^ (1 << (self.L - 1 - site)), idx] -= d
+        _, v = np.linalg.eigh(H_mod)
+        psi, est = self.deformed_state(sites_deltas)
+        infidelity = 1.0 - abs(np.vdot(v[:, 0], psi.reshape(-1)))**2
+        return {'infidelity': infidelity, 'estimate': est}
@@ -1,54 +1,371 @@
 import numpy as np
 import time
+import hashlib
 import sys
-from functools import reduce
+from functools import reduce, lru_cache
 from scipy.sparse import csr_matrix, kron, identity
 from scipy.sparse import csr_matrix, kron, identity
 from scipy.sparse.linalg import eigsh
-from scipy.linalg import expm
+from pauli_chain import PauliChainOperator, assemble_csr, chain_terms
+from symmetry_sectors import symmetric_ground_state, symmetric_full_eigh, magnetization_ground_state, symmetry_blocks, resolved_spectra
+from spectral_cache import SpectralStore, ByteBudgetCache, hamiltonian_digest
+from continuation_solver import ContinuationSolver
+from linear_response import LinearResponseEngine
+from free_fermion import GaussianTFIM, GaussianState, GaussianQuench, majorana_hamiltonian
+from mps import MPS, DMRGEngine, TEBDEvolver
+from krylov_propagator import KrylovPropagator
+from spectral_propagator import SpectralPropagator
+from chebyshev_propagator import ChebyshevPropagator
+from crossing_search import CrossingSearch
+from wick_audit import WickAuditor
+from level_statistics import LevelPool, r_ratios
+from window_scan import WindowGrid, scan_map
 
 # Global Cache for Potato PC performance
-GLOBAL_CACHE = {}
+# LRU bounded by $GLOBAL_CACHE_BYTES (default 1 GiB) so long sweeps stay flat in memory
+GLOBAL_CACHE = ByteBudgetCache()
+
+# Persistent ground states / spectra shared across runs (see spectral_cache.py)
+SPECTRAL_STORE = SpectralStore()
+
+# Above this size H is never materialized; solvers act through PauliChainOperator
+MATRIX_FREE_MIN_L = 20
+
+# Up to this size the dense solver runs per (parity, momentum) block
+SYMMETRY_DENSE_MAX_L = 16
+
+# Up to this size dynamics reuse a full (stored) eigendecomposition; beyond it, Krylov
+SPECTRAL_EVOLUTION_MAX_L = 12
+
+# Largest window block on the MPS path: κ4 and χ_rel need the dense 2^l RDM and 4^l Paulis
+MPS_WINDOW_MAX_L = 8
+
+@lru_cache(maxsize=None)
+def _partial_trace_plan(L, indices):
+    """
+    Transpose plan for an arbitrary site set: (perm, dim_a, dim_b) with the subsystem
+    axes first. Cached per (L, indices), so repeated scans reuse it.
+    """
+    target = sorted(set(indices))
+    rest = [i for i in range(L) if i not in target]
+    return tuple(target + rest), 2**len(target), 2**len(rest)
+
+def _subsystem_matrix(state, indices):
+    """
+    State as a (dim_a, dim_b) matrix for the subsystem/complement split.
+    """
+    l = int(np.round(np.log2(state.size)))
+    perm, dim_a, dim_b = _partial_trace_plan(l, tuple(sorted(indices)))
+    return state.reshape(*(2 for _ in range(l))).transpose(perm).reshape(dim_a, dim_b)
+
+def _smaller_side_gram(M):
+    # M M^† and M^T M^* share their nonzero spectrum; form the smaller one
+    return M @ M.conj().T if M.shape[0] <= M.shape[1] else M.T @ M.conj()
 
 def compute_entropy(state, indices):
     """
     Compute von Neumann entropy for a subsystem.
-    Efficiently handles the partial trace without full state tensordots where possible.
+    indices may be any site set (e.g. two separated intervals); the partial trace is a
+    single cached transpose and the Gram matrix is formed on the smaller side.
     Note: Returns entropy in natural units (nats).
     """
-    # Director's Fix: Explicitly assert contiguous indices for this optimized reshape method
-    if indices:
-        assert sorted(indices) == list(range(min(indices), max(indices)+1)), "optimization requires contiguous indices"
+    if isinstance(state, (MPS, GaussianState)):
+        return state.entropy(indices)
 
-    # Flattening for partial trace
-    l = int(np.round(np.log2(state.size)))
-    # Permute indices to the front
-    target_indices = sorted(indices)
-    rest_indices = sorted([i for i in range(l) if i not in target_indices])
-    
     # We use reshape instead of slow tensordots for pure state trace
-    # state shape is (2,2,2....)
-    permuted = np.moveaxis(state, target_indices, range(len(target_indices)))
-    dim_a = 2**len(target_indices)
-    dim_b = 2**len(rest_indices)
-    rho_a = permuted.reshape(dim_a, dim_b)
-    # Reduced density matrix rho = psi_matrix @ psi_matrix.H
-    rho = rho_a @ rho_a.conj().T
+    rho = _smaller_side_gram(_subsystem_matrix(state, indices))
     
     eigvals = np.linalg.eigvalsh(rho)
     eigvals = eigvals[eigvals > 1e-12]
     return -np.sum(eigvals * np.log(eigvals))
 
+def schmidt_profile(state, rank_tol=1e-15):
+    """
+    Schmidt coefficients of every cut [0, ℓ) | [ℓ, L), ℓ = 1..L-1, without re-reading the state.
+    Cuts ℓ <= L/2 are swept from the left and the rest from the reversed state, so each
+    Gram matrix lives on the smaller side. At each cut M M^† = U Λ U^† gives Λ = S², and
+    U^† M (Schmidt rank x rest) is carried to the next cut; Λ below rank_tol * Λ_max is dropped.
+    """
+    if isinstance(state, MPS):
+        return state.schmidt_spectrum()
+    L = state.ndim
+    def half_sweep(rest, n_cuts):
+        spectra = []
+        for _ in range(n_cuts):
+            M = rest.reshape(rest.shape[0] * 2, -1)
+            lam, U = np.linalg.eigh(M @ M.conj().T)
+            lam, U = lam[::-1], U[:, ::-1]
+            keep = max(1, int(np.sum(lam > rank_tol * lam[0])))
+            spectra.append(np.sqrt(np.clip(lam, 0.0, None)))
+            rest = U[:, :keep].conj().T @ M
+        return spectra
+    left = half_sweep(state.reshape(1, -1), L // 2)
+    right = half_sweep(state.T.reshape(1, -1), L - 1 - L // 2)
+    return left + right[::-1]
+
+def _block_probabilities(state, indices):
+    """
+    Entanglement spectrum of a block (any site set for state vectors, contiguous for MPS).
+    """
+    if isinstance(state, MPS):
+        sites = sorted(indices)
+        if sites[0] == 0 or sites[-1] == state.L - 1:
+            cut = sites[-1] + 1 if sites[0] == 0 else sites[0]
+            return state.schmidt_values(cut)**2
+        return np.linalg.eigvalsh(state.reduced_density_matrix(sites))
+    return np.linalg.eigvalsh(_smaller_side_gram(_subsystem_matrix(state, indices)))
+
+def renyi_entropy(probs, alpha=1):
+    """
+    S_α = log(Σ p^α) / (1 - α); α=1 is von Neumann, α=np.inf the min-entropy (nats).
+    """
+    p = np.asarray(probs)
+    p = p[p > 1e-12]
+    if alpha == 1:
+        return -np.sum(p * np.log(p))
+    if alpha == np.inf:
+        return -np.log(np.max(p))
+    return np.log(np.sum(p**alpha)) / (1 - alpha)
+
+def entanglement_profile(state, alphas=(1,), blocks=None):
+    """
+    Rényi entropies for many subsystems of one state at once.
+    blocks=None: every cut [0, ℓ), ℓ = 1..L-1, from a single Schmidt sweep.
+    blocks: list of index lists (e.g. centred or two-interval regions).
+    Returns {alpha: array}, one entry per ℓ / block.
+    """
+    if blocks is None:
+        probs = [S**2 for S in schmidt_profile(state)]
+    else:
+        probs = [_block_probabilities(state, b) for b in blocks]
+    return {a: np.array([renyi_entropy(p, a) for p in probs]) for a in alphas}
+
 def compute_mutual_info(state, idx_a, idx_b):
     s_a = compute_entropy(state, idx_a)
     s_b = compute_entropy(state, idx_b)
     s_ab = compute_entropy(state, idx_a + idx_b)
     return s_a + s_b - s_ab
 
+# Single-site Pauli basis (I, X, Y, Z) for rebuilding 1- and 2-site RDMs from expectations
+PAULI_BASIS = np.array([[[1, 0], [0, 1]], [[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]])
+
+def pauli_expectations(state, chunk=1 << 16):
+    """
+    All one- and two-site Pauli expectations in one batched contraction.
+    Columns Φ = [X_j ψ, (iY)_j ψ, Z_j ψ] (real for real ψ) are built chunk by chunk from
+    bit flips/signs; the Gram Φ^† Φ gives <P_i Q_j> = <P_i ψ|Q_j ψ> for i != j.
+    Returns (one (L, 4), two (L, L, 4, 4)), index 0 = identity, with Y restored from iY.
+    """
+    L = int(np.round(np.log2(state.size)))
+    psi = state.reshape(-1)
+    masks = 1 << (L - 1 - np.arange(L))
+    G = np.zeros((3 * L, 3 * L), dtype=psi.dtype)
+    v = np.zeros(3 * L, dtype=psi.dtype)
+    for start in range(0, psi.size, chunk):
+        idx = np.arange(start, min(start + chunk, psi.size))
+        flipped = psi[idx[:, None] ^ masks]
+        signs = 1 - 2 * ((idx[:, None] & masks) != 0)
+        phi = np.hstack([flipped, signs * flipped, signs * psi[idx, None]])
+        G += phi.conj().T @ phi
+        v += psi[idx].conj() @ phi
+    # Y = -i (iY): <P_i Q_j> picks up conj(c_P) c_Q
+    c = np.repeat(np.array([1.0, -1j, 1.0]), L)
+    G = (c.conj()[:, None] * G * c[None, :]).reshape(3, L, 3, L).transpose(1, 3, 0, 2)
+    one = np.ones((L, 4), dtype=complex)
+    one[:, 1:] = (c * v).reshape(3, L).T
+    two = np.ones((L, L, 4, 4), dtype=complex)
+    two[:, :, 1:, 1:] = G
+    two[:, :, 1:, 0] = one[:, None, 1:]
+    two[:, :, 0, 1:] = one[None, :, 1:]
+    return np.real_if_close(one), two
+
+def mutual_info_matrix(state, chunk=1 << 16):
+    """
+    Full L x L matrix I(i:j) = S_i + S_j - S_ij (zero diagonal).
+    One- and two-site RDMs come from pauli_expectations (ρ = Σ <P Q> P⊗Q / 4) and all
+    entropies from one stacked eigvalsh.
+    """
+    one, two = pauli_expectations(state, chunk)
+    L = one.shape[0]
+    rho1 = np.einsum('ip,pab->iab', one, PAULI_BASIS) / 2
+    pair_basis = np.einsum('pac,qbd->pqabcd', PAULI_BASIS, PAULI_BASIS).reshape(4, 4, 4, 4)
+    rho2 = np.einsum('ijpq,pqxy->ijxy', two, pair_basis) / 4
+    def entropies(rhos):
+        p = np.clip(np.linalg.eigvalsh(rhos), 1e-300, None)
+        return -np.sum(np.where(p > 1e-12, p * np.log(p), 0.0), axis=-1)
+    s1 = entropies(rho1)
+    iu = np.triu_indices(L, 1)
+    s2 = entropies(rho2[iu])
+    mi = np.zeros((L, L))
+    mi[iu] = s1[iu[0]] + s1[iu[1]] - s2
+    return mi + mi.T
+
+# σ_a σ_b = phase * σ_c over (I, X, Y, Z)
+_PAULI_PRODUCT = {(a, b): (1.0, a ^ b) if 0 in (a, b) or a == b else
+                  (1j if (b - a) % 3 == 1 else -1j, 6 - a - b)
+                  for a in range(4) for b in range(4)}
+_PRODUCT_INDEX = np.array([[_PAULI_PRODUCT[(a, b)][1] for b in range(4)] for a in range(4)])
+_PRODUCT_PHASE = np.array([[_PAULI_PRODUCT[(a, b)][0] for b in range(4)] for a in range(4)])
+
+class PauliCorrelators:
+    """
+    All Pauli-string expectations of an n-site density matrix, without operator matrices.
+    ρ is viewed as the rank-2n tensor ρ[r_1..r_n, c_1..c_n]; contracting each (r_s, c_s)
+    pair with the single-site Pauli basis is one axis-local tensordot (O(d^2) each), and
+    leaves T[p_1..p_n] = Tr(ρ σ_{p_1} ⊗ ... ⊗ σ_{p_n}). Every k-point correlator is then
+    a lookup at the flat index Σ_s p_s 4^(n-1-s).
+    """
+    def __init__(self, rho):
+        n = int(np.round(np.log2(rho.shape[0])))
+        T = rho.reshape((2,) * (2 * n))
+        for m in range(n, 0, -1):
+            # Remaining sites: r axes 0..m-1, c axes m..2m-1; new Pauli axis appended last
+            T = np.tensordot(T, PAULI_BASIS, axes=([0, m], [2, 1]))
+        self.n = n
+        self.coeffs = np.real(T).reshape(-1)
+        self.weights = 4 ** (n - 1 - np.arange(n))
+
+    def expectation(self, word):
+        """
+        <Π σ> for word = [(site, pauli), ...] in operator order (pauli 0..3 or 'IXYZ');
+        repeated sites are multiplied out first. Complex in general: the product of
+        non-commuting factors (e.g. X_0 Y_0 = i Z_0) is not Hermitian.
+        """
+        local = {}
+        phase = 1.0
+        for site, p in word:
+            p = 'IXYZ'.index(p) if isinstance(p, str) else p
+            ph, local[site] = _PAULI_PRODUCT[(local.get(site, 0), p)]
+            phase *= ph
+        idx = sum(p * self.weights[site] for site, p in local.items())
+        return phase * self.coeffs[idx]
+
+    def correlators(self, sites, paulis=(1, 2, 3)):
+        """
+        <σ^{a_1}_{s_1} ... σ^{a_k}_{s_k}> for rows of distinct sites (K, k) and every Pauli
+        assignment from paulis: array (K, len(paulis)^k), assignments in itertools.product order.
+        """
+        sites = np.atleast_2d(sites)
+        k = sites.shape[1]
+        grid = np.array(np.meshgrid(*([paulis] * k), indexing='ij')).reshape(k, -1).T
+        idx = (grid[None, :, :] * self.weights[sites][:, None, :]).sum(axis=-1)
+        return self.coeffs[idx]
+
+    def two_point(self, paulis=(1, 2, 3)):
+        """
+        C[a, b, i, j] = <σ^a_i σ^b_j> for i != j (diagonal left at zero).
+        """
+        n, m = self.n, len(paulis)
+        i, j = np.nonzero(~np.eye(n, dtype=bool))
+        C = np.zeros((m, m, n, n))
+        C[:, :, i, j] = self.correlators(np.column_stack([i, j]), paulis).reshape(-1, m, m).transpose(1, 2, 0)
+        return C
+
+def majorana_strings(n):
+    """
+    Pauli index of γ_a on each site, P[a, s] (Jordan-Wigner with X strings, as free_fermion):
+    γ_{2j} = (Π_{k<j} X_k) Z_j,  γ_{2j+1} = (Π_{k<j} X_k) Y_j.
+    """
+    P = np.zeros((2 * n, n), dtype=int)
+    for j in range(n):
+        P[2*j:2*j+2, :j] = 1
+        P[2*j, j] = 3
+        P[2*j+1, j] = 2
+    return P
+
+class MajoranaCumulant:
+    """
+    Connected 4-point function of the subsystem Majoranas over ALL ordered quadruples,
+        κ_abcd = <γ_a γ_b γ_c γ_d> - (G_ab G_cd - G_ac G_bd + G_ad G_bc),   G_ab = <γ_a γ_b>,
+    which vanishes identically for Gaussian states. Majorana products are Pauli strings,
+    so both functions are batched lookups into PauliCorrelators (product tables per site).
+    The formula assumes parity-even states; odd moments <γ_a>, <γ_a γ_b γ_c> (nonzero when
+    H breaks fermion parity, e.g. a longitudinal Z field) are non-Gaussian on their own
+    and are returned separately by odd_moments (no c-number odd cumulant exists).
+    """
+    def __init__(self, rho, correlators=None):
+        self.correlators = PauliCorrelators(rho) if correlators is None else correlators
+        self.n = self.correlators.n
+        self.m = 2 * self.n
+        self.P = P = majorana_strings(self.n)
+        # Pair products γ_a γ_b: Pauli indices (m, m, n) and phases (m, m)
+        self.pair_idx = _PRODUCT_INDEX[P[:, None, :], P[None, :, :]]
+        self.pair_phase = np.prod(_PRODUCT_PHASE[P[:, None, :], P[None, :, :]], axis=-1)
+        self.G = self._lookup(self.pair_idx, self.pair_phase)
+
+    def _lookup(self, idx, phase):
+        return phase * self.correlators.coeffs[idx @ self.correlators.weights]
+
+    def four_point(self, a, b, c, d):
+        """
+        <γ_a γ_b γ_c γ_d> for broadcastable index arrays.
+        """
+        left, right = self.pair_idx[a, b], self.pair_idx[c, d]
+        phase = self.pair_phase[a, b] * self.pair_phase[c, d] * np.prod(_PRODUCT_PHASE[left, right], axis=-1)
+        return self._lookup(_PRODUCT_INDEX[left, right], phase)
+
+    def moment(self, *idx):
+        """
+        <γ_{i_1} ... γ_{i_k}> for broadcastable index arrays.
+        """
+        cur = self.P[idx[0]]
+        phase = np.ones(cur.shape[:-1], dtype=complex)
+        for i in idx[1:]:
+            nxt = self.P[i]
+            phase = phase * np.prod(_PRODUCT_PHASE[cur, nxt], axis=-1)
+            cur = _PRODUCT_INDEX[cur, nxt]
+        return self._lookup(cur, phase)
+
+    def odd_moments(self):
+        """
+        (<γ_a> (m,), <γ_a γ_b γ_c> (m, m, m)); both vanish for parity-even states.
+        """
+        r = np.arange(self.m)
+        a, b, c = np.meshgrid(r, r, r, indexing='ij')
+        return self.moment(r), self.moment(a, b, c)
+
+    def cumulant(self, a, b, c, d):
+        G = self.G
+        wick = G[a, b] * G[c, d] - G[a, c] * G[b, d] + G[a, d] * G[b, c]
+        return self.four_point(a, b, c, d) - wick
+
+    def tensor(self):
+        """
+        Full κ (m, m, m, m), one batched contraction per leading index (bounded memory).
+        """
+        r = np.arange(self.m)
+        b, c, d = np.meshgrid(r, r, r, indexing='ij')
+        return np.array([self.cumulant(a, b, c, d) for a in r])
+
+    def frobenius_norm(self):
+        return np.sqrt(np.sum(np.abs(self.tensor())**2))
+
+    def sampled_norm(self, n_per_stratum=64, seed=0, z=1.96):
+        """
+        Stratified estimate of ||κ||_F (strata = leading index a, uniform draws of (b, c, d))
+        from its own Generator. Returns (estimate, (low, high)) at ~95% confidence for z=1.96.
+        """
+        rng = np.random.default_rng(seed)
+        size = self.m**3
+        total, var = 0.0, 0.0
+        for a in range(self.m):
+            b, c, d = rng.integers(0, self.m, (3, n_per_stratum))
+            sq = np.abs(self.cumulant(a, b, c, d))**2
+            total += size * sq.mean()
+            var += size**2 * sq.var(ddof=1) / n_per_stratum
+        half = z * np.sqrt(var)
+        return np.sqrt(total), (np.sqrt(max(total - half, 0.0)), np.sqrt(total + half))
+
 def setup_tfim_hamiltonian_fast(L, h=1.0):
     """
     Optimized Hamiltonian construction for Potato PCs.
-    Builds the full sum of terms using sparse reduction.
+    Direct COO assembly over the basis indices (bit-identical to the kron reference).
+    """
+    return assemble_csr(L, chain_terms('TFIM', L, h=h))
+
+def setup_tfim_hamiltonian_kron(L, h=1.0):
+    """
+    Reference construction: builds the full sum of terms using sparse kron reduction.
     """
     sx = csr_matrix([[0, 1], [1, 0]])
     sz = csr_matrix([[1, 0], [0, -1]])
@@ -78,9 +395,18 @@ class HamiltonianFactory:
     """
     Phase 7: Generates Hamiltonians for Comparative Dynamics Scan.
     Supports: TFIM (Integrable), XXZ (Interacting), Chaotic (Broken Integrability).
+    backend='sparse' assembles CSR directly from the Pauli-chain term list,
+    backend='operator' returns a matrix-free LinearOperator instead of a sparse matrix,
+    backend='kron' is the original kron-reduction reference builder.
     """
     @staticmethod
-    def create(model_type, L, **params):
+    def create(model_type, L, backend='sparse', **params):
+        if backend == 'sparse':
+            return assemble_csr(L, chain_terms(model_type, L, **params))
+        elif backend == 'operator':
+            return PauliChainOperator.from_model(model_type, L, **params)
+        elif backend != 'kron':
+            raise ValueError(f"Unknown backend: {backend}")
         if model_type == 'TFIM':
             return HamiltonianFactory._tfim(L, h=params.get('h', 1.0))
         elif model_type == 'XXZ':
@@ -92,7 +418,7 @@ class HamiltonianFactory:
 
     @staticmethod
     def _tfim(L, h):
-        return setup_tfim_hamiltonian_fast(L, h)
+        return setup_tfim_hamiltonian_kron(L, h)
 
     @staticmethod
     def _xxz(L, delta):
@@ -115,7 +441,7 @@ class HamiltonianFactory:
     @staticmethod
     def _chaotic(L, h, g):
         # TFIM + Longitudinal Field (Z) to break integrability
-        H_tfim = setup_tfim_hamiltonian_fast(L, h)
+        H_tfim = setup_tfim_hamiltonian_kron(L, h)
         sz = csr_matrix([[1, 0], [0, -1]])
         id2 = identity(2)
         id_chain = [id2] * L
@@ -129,50 +455,132 @@ class HamiltonianFactory:
         H_z = reduce(lambda x, y: x + y, z_terms)
         return H_tfim + H_z
 
-def get_ground_state(L, h=1.0):
+def benchmark_hamiltonian_assembly(L_values=range(8, 21, 2), models=None, kron_max_L=12):
+    """
+    Phase 7 Support: Build time of direct COO assembly vs the kron reference.
+    Also checks the two builders agree bit-for-bit.
+    The kron reference densifies its intermediate BSR blocks (~1 GB per term at L=14),
+    so it is only run up to kron_max_L; larger L report the COO build alone.
+    """
+    if models is None:
+        models = [('TFIM', {'h': 1.0}), ('XXZ', {'delta': 0.5}), ('Chaotic', {'h': 1.0, 'g': 0.5})]
+    print(f"{'Model':>8} | {'L':>3} | {'kron (s)':>10} | {'COO (s)':>10} | {'Speedup':>8} | {'Identical':>9}", flush=True)
+    print("-" * 62, flush=True)
+    results = []
+    for name, params in models:
+        for L in L_values:
+            start = time.time()
+            H_coo = HamiltonianFactory.create(name, L, **params)
+            t_coo = time.time() - start
+            
+            if kron_max_L is not None and L > kron_max_L:
+                results.append((name, L, None, t_coo, None))
+                print(f"{name:>8} | {L:3d} | {'skipped':>10} | {t_coo:10.4f} | {'-':>8} | {'-':>9}", flush=True)
+                continue
+            
+            start = time.time()
+            H_ref = HamiltonianFactory.create(name, L, backend='kron', **params).tocsr()
+            t_kron = time.time() - start
+            
+            H_ref.eliminate_zeros()
+            H_ref.sort_indices()
+            identical = (H_ref.dtype == H_coo.dtype
+                         and np.array_equal(H_ref.indptr, H_coo.indptr)
+                         and np.array_equal(H_ref.indices, H_coo.indices)
+                         and np.array_equal(H_ref.data, H_coo.data))
+            del H_ref, H_coo
+            results.append((name, L, t_kron, t_coo, identical))
+            print(f"{name:>8} | {L:3d} | {t_kron:10.4f} | {t_coo:10.4f} | {t_kron/t_coo:7.1f}x | {str(identical):>9}", flush=True)
+    return results
+
+def get_ground_state(L, h=1.0, matrix_free=None):
     cache_key = (L, h)
-    if cache_key in GLOBAL_CACHE:
-        return GLOBAL_CACHE[cache_key]
+    cached = GLOBAL_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    if matrix_free is None:
+        matrix_free = L >= MATRIX_FREE_MIN_L
     
     print(f"[Compute] Constructing H for L={L}...")
     start = time.time()
-    H = setup_tfim_hamiltonian_fast(L, h)
     
-    # Standardize on dense solver for L <= 10 (Avoids ARPACK hangs)
-    if L <= 10:
-        print(f"[Solver] Using dense eigh (dim={2**L})...")
-        eigvals, eigvecs = np.linalg.eigh(H.toarray())
-        psi = eigvecs[:, 0]
-    else:
+    def solve():
+        if matrix_free:
+            H = HamiltonianFactory.create('TFIM', L, backend='operator', h=h)
+        else:
+            H = setup_tfim_hamiltonian_fast(L, h)
+        
+        if matrix_free:
+            # No dense fallback: H is never materialized
+            print(f"[Solver] Using matrix-free eigsh (dim={2**L})...")
+            eigvals, eigvecs = eigsh(H, k=1, which='SA')
+            return eigvals[0], eigvecs[:, 0]
+        # Standardize on dense solver for L <= 16 (Avoids ARPACK hangs)
+        # Periodic TFIM conserves Z2 parity and momentum: eigh runs per (p, k) block
+        elif L <= SYMMETRY_DENSE_MAX_L:
+            print(f"[Solver] Using block dense eigh (dim={2**L}, {2*L} symmetry sectors)...")
+            E0, psi, _ = symmetric_ground_state('TFIM', L, h=h)
+            return E0, psi
         print(f"[Solver] Using sparse eigsh (dim={2**L})...")
         try:
             eigvals, eigvecs = eigsh(H, k=1, which='SA')
-            psi = eigvecs[:, 0]
         except Exception as e:
             print(f"[Warning] Sparse solver failed ({e}), falling back to dense...")
             eigvals, eigvecs = np.linalg.eigh(H.toarray())
-            psi = eigvecs[:, 0]
-            
-    state = psi.reshape(*(2 for _ in range(L)))
+        return eigvals[0], eigvecs[:, 0]
+    
+    _, state = SPECTRAL_STORE.ground_state('TFIM', L, {'h': h}, solve)
     GLOBAL_CACHE[cache_key] = state
     print(f"[Success] Ground state ready ({time.time()-start:.2f}s)")
     return state
 
-def validate_central_charge(L):
+def get_model_ground_state(name, L, H_sparse, **params):
     """
-    Refinement 1: Verify central charge scaling c=0.5.
+    Phases 7-10: Ground state of a HamiltonianFactory model using its conserved quantities.
+    TFIM: parity/momentum blocks. XXZ: fixed-S^z sectors. Otherwise dense eigh.
     """
-    state = get_ground_state(L)
-    print(f"\n[Refinement 1] Central Charge Validation (L={L})")
+    def solve():
+        if name == 'TFIM':
+            E0, psi0, _ = symmetric_ground_state(name, L, **params)
+        elif name == 'XXZ':
+            E0, psi0, _ = magnetization_ground_state(name, L, **params)
+        else:
+            w, v = np.linalg.eigh(H_sparse.toarray())
+            E0, psi0 = w[0], v[:, 0]
+        return E0, psi0
     
-    sub_ls = range(1, L // 2 + 1)
+    _, psi0 = SPECTRAL_STORE.ground_state(name, L, params, solve, dtype=H_sparse.dtype)
+    return psi0
+
+def validate_central_charge(L, backend='exact', n_points=None):
+    """
+    Refinement 1: Verify central charge scaling c=0.5.
+    backend='gaussian' reads S(ℓ) off the Majorana correlation matrix (L in the thousands);
+    n_points then samples ℓ geometrically instead of scanning every ℓ ≤ L/2.
+    """
+    if backend == 'gaussian':
+        gaussian = GaussianTFIM(L)
+        entropy = gaussian.entropy
+    else:
+        state = get_ground_state(L)
+        # One Schmidt sweep gives S(ℓ) for every cut
+        profile = entanglement_profile(state)[1]
+        entropy = lambda sites: profile[len(sites) - 1]
+    label = "" if backend == 'exact' else f", backend={backend}"
+    print(f"\n[Refinement 1] Central Charge Validation (L={L}{label})")
+    
+    if n_points is None:
+        sub_ls = range(1, L // 2 + 1)
+    else:
+        sub_ls = np.unique(np.geomspace(1, L // 2, n_points).astype(int))
     entropies = []
     log_chords = []
     
     print(f"{'ℓ':>4} | {'S(ℓ)':>10} | {'Chord Dist':>10}")
     print("-" * 35)
     for l in sub_ls:
-        s = compute_entropy(state, list(range(l)))
+        s = entropy(list(range(l)))
         chord = (L / np.pi) * np.sin(np.pi * l / L)
         entropies.append(s)
         log_chords.append(np.log(chord))
@@ -184,51 +592,68 @@ def validate_central_charge(L):
     print(f"Result: c ≈ {c_est:.4f} (Expected: 0.5)")
     return c_est
 
-def validate_fermionic_wick_tfim(L=4):
+def crosscheck_gaussian_backend(L=8, h=1.0, delta_h=0.2):
+    """
+    Max deviation of the Gaussian backend from the state-vector path:
+    S of every contiguous block, and D(ρ_p || ρ_0) on blocks where ρ_0 has full rank.
+    """
+    state0 = get_ground_state(L, h)
+    state_p = get_deformed_state(L, [(0, delta_h)], base_h=h)
+    g0 = GaussianTFIM(L, h=h)
+    gp = GaussianTFIM(L, h=h, sites_deltas=[(0, delta_h)])
+    ds_max = max(abs(g0.entropy(list(range(m, m + l))) - compute_entropy(state0, list(range(m, m + l))))
+                 for l in range(1, L) for m in range(L - l + 1))
+    d_rel = []
+    for l in range(1, L):
+        indices = list(range(l))
+        if np.linalg.eigvalsh(compute_rho_sub(state0, indices))[0] > 1e-10:
+            d_rel.append(abs(gp.relative_entropy(g0, indices) - compute_relative_entropy(state_p, state0, indices)))
+    return {'entropy': ds_max, 'relative_entropy': max(d_rel)}
+
+def crosscheck_gaussian_quench(L=8, h=1.0, eps=0.05, times=(0.0, 0.5, 1.0, 2.0, 4.0)):
+    """
+    Max deviation of the Gaussian quench engine from the state-vector path: δS of every
+    contiguous block, for ψ_a, ψ_b, ψ_ab (sites 0 and L-1) evolved under H_0.
+    """
+    deformations = [[], [(0, eps)], [(L - 1, eps)], [(0, eps), (L - 1, eps)]]
+    quench = GaussianQuench(majorana_hamiltonian(L, h=h))
+    gaussian = [GaussianTFIM(L, h=h, sites_deltas=sd).Gamma for sd in deformations]
+    dense = [get_ground_state(L, h)] + [get_deformed_state(L, sd, base_h=h) for sd in deformations[1:]]
+    H_sparse = setup_tfim_hamiltonian_fast(L, h=h)
+    evolver = TimeEvolver(H_sparse, eig=get_model_spectrum('TFIM', L, H_sparse, h=h))
+    blocks = [list(range(m, m + l)) for l in range(1, L) for m in range(L - l + 1)]
+    err = 0.0
+    for (t, g_t), (_, d_t) in zip(quench.evolve_grid(gaussian, times), evolver.evolve_grid(dense, times)):
+        for sites in blocks:
+            dg = [compute_entropy(g, sites) - compute_entropy(g_t[0], sites) for g in g_t[1:]]
+            dd = [compute_entropy(d, sites) - compute_entropy(d_t[0], sites) for d in d_t[1:]]
+            err = max(err, np.max(np.abs(np.subtract(dg, dd))))
+    return err
+
+def validate_fermionic_wick_tfim(L=4, state=None, orders=(4,), n_samples=None, tol=1e-10):
     """
     Gold Standard Verification: Proves the global TFIM ground state is Gaussian.
-    Tests <g1 g2 g3 g4> - Wick(<gg><gg>) = 0 for Majoranas.
+    Tests <g1 g2 g3 g4> - Wick(<gg><gg>) = 0 for Majoranas, for every index tuple
+    (Pfaffians of the full 2L x 2L two-point matrix; WickAuditor, no operator matrices),
+    plus the pure-state certificate Γ^T Γ = 1.
+    state: any (2,)*L vector, e.g. an evolved state (default: TFIM ground state).
+    n_samples: tuples per order (own Generator); default all for L <= 12, 2000 beyond.
     """
     print(f"\n[Audit] First-Principles Wick Validation (L={L})")
-    H_sparse = HamiltonianFactory.create('TFIM', L, h=1.0)
-    w, v = np.linalg.eigh(H_sparse.toarray())
-    psi0 = v[:, 0]
-    
-    # Majorana Operators for L=4
-    def get_majorana(idx, L):
-        site = idx // 2
-        is_even = (idx % 2 == 1)
-        
-        # String of Zs
-        ops = [identity(2)] * L
-        for s in range(site):
-            ops[s] = csr_matrix([[1, 0], [0, -1]]) # Z
-        
-        # X or Y at site
-        if not is_even:
-            ops[site] = csr_matrix([[0, 1], [1, 0]]) # X
-        else:
-            ops[site] = csr_matrix([[0, -1j], [1j, 0]]) # Y
-            
-        return reduce(kron, ops)
-
-    indices = [0, 1, 2, 3] # Majoranas on site 0 and 1
-    mj = [get_majorana(i, L) for i in indices]
-    
-    # 2-point <gi gj>
-    C = np.zeros((4,4), dtype=complex)
-    for i in range(4):
-        for j in range(4):
-            C[i,j] = psi0.conj().T @ (mj[i] @ mj[j] @ psi0)
-            
-    # 4-point <g0 g1 g2 g3>
-    val4 = psi0.conj().T @ (mj[0] @ mj[1] @ mj[2] @ mj[3] @ psi0)
-    wick = C[0,1]*C[2,3] - C[0,2]*C[1,3] + C[0,3]*C[1,2]
-    
-    cumulant = abs(val4 - wick)
-    print(f"4-point Majorana Cumulant: {cumulant:.2e}")
-    print("Result: Verified (Global TFIM is Gaussian).")
-    return cumulant < 1e-10
+    psi0 = get_ground_state(L) if state is None else state
+    if n_samples is None and L > 12:
+        n_samples = 2000
+    report = WickAuditor(psi0).audit(orders, n_samples)
+    
+    print(f"Pure-State Certificate |Γ^TΓ - 1|: {report['purity']:.2e}")
+    for order in orders:
+        print(f"{order}-point Majorana Cumulant: {report[f'wick_{order}']:.2e}")
+    passed = max(report.values()) < tol
+    if passed:
+        print("Result: Verified (Global TFIM is Gaussian).")
+    else:
+        print("Result: FAILED (Wick factorization violated).")
+    return passed
 
 class ModularDiagnostic:
     """
@@ -236,83 +661,131 @@ class ModularDiagnostic:
     Measures deviations from Gaussianity (Wick factorization).
     """
     @staticmethod
-    def get_correlators_pauli(rho, sub_indices):
+    def get_correlators_pauli(rho, sub_indices, engine=None):
         """
         Computes the 2-point and 4-point Pauli correlators Tr(rho * sigma_i * sigma_j).
         Used as proxies for fermionic correlators in the TFIM/XXZ mapping.
+        Read off the Pauli-coefficient tensor of rho (PauliCorrelators); no operator matrices.
         """
-        dim = 2**len(sub_indices)
-        sx = np.array([[0, 1], [1, 0]])
-        # Helper to construct subsystem operator
-        def get_sub_op(site_idx, op):
-            ops = [np.eye(2)] * len(sub_indices)
-            ops[site_idx] = op
-            return reduce(np.kron, ops)
-            
-        # 2-point matrix C_ij = <X_i X_j>
-        C = np.zeros((len(sub_indices), len(sub_indices)))
-        for i in range(len(sub_indices)):
-            for j in range(i, len(sub_indices)):
-                op = get_sub_op(i, sx) @ get_sub_op(j, sx)
-                val = np.real(np.trace(rho @ op))
-                C[i, j] = C[j, i] = val
+        engine = PauliCorrelators(rho) if engine is None else engine
+        # 2-point matrix C_ij = <X_i X_j>, X_i^2 = 1 on the diagonal
+        C = engine.two_point(paulis=(1,))[0, 0]
+        np.fill_diagonal(C, 1.0)
         return C
 
     @staticmethod
-    def compute_cumulant_norm(rho, sub_indices):
+    def compute_cumulant_norm(rho, sub_indices, n_per_stratum=None, seed=0):
         """
         Calculates the Connected Modular Correlator Norm (Proxy for Modular Mixing).
-        Director's Cut: Randomized Index Sampler (20 quadruples) for robustness.
+        Exact: Frobenius norm of the full Majorana 4-point cumulant over all (2n)^4 ordered
+        quadruples (MajoranaCumulant), reported per entry, ||κ||_F / (2n)^2, combined in
+        quadrature with the per-entry RMS of the odd moments <γ> and <γγγ> (parity breaking).
+        n_per_stratum: stratified sampling of κ instead (large subsystems), own Generator(seed).
         Note: Measures boundary-induced non-Gaussianity in the reduced state.
         """
-        L_sub = len(sub_indices)
-        sx = np.array([[0, 1], [1, 0]])
-        def get_op(idx):
-            ops = [np.eye(2)] * L_sub
-            ops[idx] = sx
-            return reduce(np.kron, ops)
-            
-        C = ModularDiagnostic.get_correlators_pauli(rho, sub_indices)
-        
-        # Robust Randomized Sampling
-        np.random.seed(42) # Deterministic audit
-        sum_sq = 0
-        n_samples = 20
-        for _ in range(n_samples):
-            i, j, k, l = np.random.randint(0, L_sub, 4)
-            op4 = get_op(i) @ get_op(j) @ get_op(k) @ get_op(l)
-            val4 = np.real(np.trace(rho @ op4))
-            # Wick contraction (Gaussian Reference)
-            wick = C[i,j]*C[k,l] + C[i,k]*C[j,l] + C[i,l]*C[j,k]
-            sum_sq += (val4 - wick)**2
-            
-        return np.sqrt(sum_sq / n_samples)
+        cumulant = MajoranaCumulant(rho)
+        if n_per_stratum is None:
+            norm = cumulant.frobenius_norm()
+        else:
+            norm, _ = cumulant.sampled_norm(n_per_stratum, seed)
+        m = cumulant.m
+        g1, g3 = cumulant.odd_moments()
+        odd_sq = np.sum(np.abs(g1)**2) / m + np.sum(np.abs(g3)**2) / m**3
+        return np.sqrt((norm / m**2)**2 + odd_sq)
 
 class EntanglementSpectrumAnalyzer:
     """
     Phase 8: Level Statistics of the Modular Hamiltonian K = -log rho.
+    Vectorized r-ratios (level_statistics.py). Pooled statistics take each spectrum once,
+    resolved by symmetry sector, with independent states (disorder realizations) or energy
+    sectors as the sources of the standard error. Mixing sectors would fake Poisson.
     """
+    @staticmethod
+    def modular_spectra(rhos):
+        """
+        K spectra of a stack of equal-size density matrices (one batched eigvalsh);
+        levels with eigenvalue <= 1e-12 are NaN.
+        """
+        eigvals = np.linalg.eigvalsh(np.asarray(rhos))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(eigvals > 1e-12, -np.log(eigvals), np.nan)
+
     @staticmethod
     def analyze(rho):
-        eigvals = np.linalg.eigvalsh(rho)
-        eigvals = eigvals[eigvals > 1e-12]
-        K_spec = -np.log(eigvals)
-        K_spec = np.sort(K_spec)
-        
-        # Level spacings
-        spacings = np.diff(K_spec)
-        if len(spacings) < 2: return 0.0, K_spec
+        K_spec = EntanglementSpectrumAnalyzer.modular_spectra(rho[None])[0]
+        K_spec = np.sort(K_spec[np.isfinite(K_spec)])
+        if len(K_spec) < 3: return 0.0, K_spec
         
         # r_n = min(dn, dn+1) / max(dn, dn+1)
-        r_ns = []
-        for i in range(len(spacings)-1):
-            d1, d2 = spacings[i], spacings[i+1]
-            if d1 > 1e-9 and d2 > 1e-9:
-                r_ns.append(min(d1, d2) / max(d1, d2))
-                
-        avg_r = np.mean(r_ns) if r_ns else 0.0
+        r_ns = r_ratios(K_spec)
+        r_ns = r_ns[np.isfinite(r_ns)]
+        avg_r = np.mean(r_ns) if r_ns.size else 0.0
         return avg_r, K_spec
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def subsystem_symmetries(n):
+        """
+        Candidate symmetries of an n-site rho: S^z, spin flip X^{⊗n}, block reflection.
+        """
+        idx = np.arange(2**n)
+        flip = np.eye(2**n)[idx ^ (2**n - 1)]
+        mirrored = sum(((idx >> b) & 1) << (n - 1 - b) for b in range(n))
+        return np.diag(np.bitwise_count(idx).astype(float)), flip, np.eye(2**n)[mirrored]
+
+    @staticmethod
+    def analyze_pooled(states, blocks, pool=None):
+        """
+        Pools sector-resolved entanglement spectra of each block over independent states
+        (one LevelPool source per state). States whose rho share the same symmetries are
+        resolved together: one stacked eigvalsh per sector. Returns the LevelPool.
+        """
+        pool = LevelPool() if pool is None else pool
+        per_state = [[] for _ in states]
+        for block in blocks:
+            rhos = np.array([compute_rho_sub(state, block) for state in states])
+            candidates = EntanglementSpectrumAnalyzer.subsystem_symmetries(len(block))
+            groups = {}
+            for i, rho in enumerate(rhos):
+                key = tuple(np.max(np.abs(Q @ rho - rho @ Q)) < 1e-10 for Q in candidates)
+                groups.setdefault(key, []).append(i)
+            for key, idx in groups.items():
+                ops = [Q for Q, keep in zip(candidates, key) if keep]
+                for U in symmetry_blocks(ops, rhos.shape[-1]):
+                    K = EntanglementSpectrumAnalyzer.modular_spectra(U.conj().T @ rhos[idx] @ U)
+                    for i, row in zip(idx, K):
+                        per_state[i].append(row)
+        for i, rows in enumerate(per_state):
+            pool.add(rows, label=i)
+        return pool
+
+    @staticmethod
+    def summarize(pool, sources):
+        """
+        (<r> or NaN, printable summary) of a pool against Poisson/GOE at its own sector sizes;
+        small sectors are not compared with the large-N references.
+        """
+        avg_r, r_err, n_r, n_src = pool.mean_r()
+        if not n_r:
+            return np.nan, f"skipped (no sector with >= {pool.min_levels} levels)"
+        r_poisson, r_goe = pool.references()
+        r_pm = f" ± {r_err:.4f}" if np.isfinite(r_err) else ""  # no SE from a single source
+        lo, hi = min(pool.sizes), max(pool.sizes)
+        sizes = f"{lo}" if lo == hi else f"{lo}-{hi}"
+        return avg_r, (f"{avg_r:.4f}{r_pm} ({n_r} ratios, {n_src} {sources}; sectors of {sizes} levels, "
+                       f"where Poisson~{r_poisson:.2f}, GOE~{r_goe:.2f})")
+
+    @staticmethod
+    def energy_pooled(H_sparse, L, pool=None):
+        """
+        Energy-level statistics over the fully resolved blocks of resolved_spectra
+        (S^z, k <= L/2, flip, reflection); each block is one independent source.
+        """
+        pool = LevelPool() if pool is None else pool
+        for label, w in resolved_spectra(H_sparse, L):
+            pool.add(w, label=label)
+        return pool
+
 class CoarseGrainingDiagnostic:
     """
     Phase 9: Operational Coarse-Graining.
@@ -336,48 +809,46 @@ class StabilityAnalyzer:
     Measures the temporal boundary of the operational semiclassical regime.
     """
     @staticmethod
-    def compute_tau_add(name, H_sparse, psi0, sub_indices, t_max=4.0):
+    def compute_tau_add(name, H_sparse, psi0, sub_indices, t_max=4.0, eig=None, engine=None, tol=1e-2):
         """
-        Optimized τ_add: Uses pre-diagonalization to avoid repeated expm.
+        Optimized τ_add: Uses pre-diagonalization to avoid repeated expm (SpectralPropagator).
         τ_add is the time until functional additivity (χ_rel) deviates > 10%.
+        eig: optional precomputed (w, v) of H, e.g. from symmetric_full_eigh; without it
+        the states are propagated by Chebyshev expansion (no dense diagonalization).
+        engine: optional LinearResponseEngine for the deformed initial states.
+        Returns (τ_add string, number of χ_rel evaluations); τ is refined to tol by CrossingSearch.
         """
         L = int(np.log2(H_sparse.shape[0]))
-        H_dense = H_sparse.toarray()
-        
-        # Diagonalize once
-        w, v = np.linalg.eigh(H_dense)
-        v_h = v.conj().T
         
         eps = 0.01
-        p_a = get_deformed_state_generic(L, H_sparse, [(0, eps)])
-        p_b = get_deformed_state_generic(L, H_sparse, [(L-1, eps)])
-        p_ab = get_deformed_state_generic(L, H_sparse, [(0, eps), (L-1, eps)])
-        
-        # Pre-rotate to eigenbasis
-        psi0_eig = v_h @ psi0.reshape(-1)
-        pa_eig = v_h @ p_a.reshape(-1)
-        pb_eig = v_h @ p_b.reshape(-1)
-        pab_eig = v_h @ p_ab.reshape(-1)
-        
-        times = np.linspace(0, t_max, 15)
-        tau_add = ">" + str(t_max)
-        
-        for t in times:
-            exp_diag = np.exp(-1j * t * w)
-            def evolve_fast(eig_st):
-                return (v @ (exp_diag * eig_st)).reshape(*(2 for _ in range(L)))
-            
-            p0_t, pa_t, pb_t, pab_t = map(evolve_fast, [psi0_eig, pa_eig, pb_eig, pab_eig])
-            s0, sa, sb, sab = [compute_entropy(st, sub_indices) for st in [p0_t, pa_t, pb_t, pab_t]]
-            
-            chi = abs(sab - sa - sb + s0)
-            rel = chi / (abs(sa-s0) + abs(sb-s0)) if abs(sa-s0) > 1e-9 else 0
-            
-            if rel > 0.1 and tau_add.startswith(">"):
-                tau_add = f"{t:.2f}"
-                break
+        p_a = get_deformed_state_generic(L, H_sparse, [(0, eps)], psi_guess=psi0, engine=engine)
+        p_b = get_deformed_state_generic(L, H_sparse, [(L-1, eps)], psi_guess=psi0, engine=engine)
+        p_ab = get_deformed_state_generic(L, H_sparse, [(0, eps), (L-1, eps)], psi_guess=psi0, engine=engine)
         
-        return tau_add
+        # Coarse bracketing on the original 15-point grid (narrow excursions above 10% are
+        # missed by coarser scans) + Brent refinement, jumping the propagator to each t
+        evolver = TimeEvolver(H_sparse, eig=eig, method='chebyshev')
+        search = CrossingSearch(additivity_probe(evolver, [psi0, p_a, p_b, p_ab], sub_indices), t_max,
+                                n_coarse=15, xtol=tol)
+        tau = search.scan([0.1])[0.1]
+        tau_add = ">" + str(t_max) if tau is None else f"{tau:.2f}"
+        return tau_add, search.n_evals
+
+def _window_column(task):
+    """
+    χ_rel(t) of one (l, ε) column of the window grid: the three deformed ground states are
+    solved once and quenched under H along all times in one evolution. Module level so a
+    process pool can pickle it.
+    """
+    L, H_sparse, psi0, block, eps, times, engine = task
+    a, b = block[0], block[-1]
+    states = [psi0] + [get_deformed_state_generic(L, H_sparse, sd, psi_guess=psi0, engine=engine)
+                       for sd in ([(a, eps)], [(b, eps)], [(a, eps), (b, eps)])]
+    if max(times) == 0.0:
+        return [additivity_error(states, block)[1]] * len(times)
+    assert H_sparse is not None, "Quenched window cells (t > 0) need the exact backend"
+    evolver = TimeEvolver(H_sparse, method='chebyshev')
+    return [additivity_error(evolved, block)[1] for _, evolved in evolver.evolve_grid(states, times)]
 
 class AxiomExtractor:
     """
@@ -385,46 +856,40 @@ class AxiomExtractor:
     Audit Lock: W may be fragmented or empty; non-existence is a valid physical result.
     """
     @staticmethod
-    def get_admissible_scales(L, H_sparse, psi0, name):
+    def scan_window(L, H_sparse, psi0, name, epsilons=(0.001,), times=(0.0,), scales=None,
+                    engine=None, workers=None):
         """
-        Scans block sizes l and calculates if they pass relative scaling criteria.
-        Uses IR-suppression logic (relative kappa) instead of absolute thresholds.
+        Evaluates the semiclassical gate on the full (l, ε, t) grid; returns a WindowGrid
+        (χ_rel scores, W mask, connected components). κ4(l) and its l=2 baseline are
+        ground-state properties, computed once; (l, ε) columns fan out over a process pool.
+        On the MPS path (H_sparse None) the default scales stop at MPS_WINDOW_MAX_L.
         """
-        admissible_l = []
-        
         # 1. Baseline kappa for minimal resolution (l=2)
         idx2 = list(range(L//2 - 1, L//2 + 1))
         rho2 = compute_rho_sub(psi0, idx2)
         kappa_baseline = ModularDiagnostic.compute_cumulant_norm(rho2, idx2)
         
-        for l in range(2, L//2 + 1, 2):
-            sub_indices = list(range(L//2 - l//2, L//2 + l//2))
-            rho = compute_rho_sub(psi0, sub_indices)
-            kappa = ModularDiagnostic.compute_cumulant_norm(rho, sub_indices)
-            
-            # Parametric Suppression: Is kappa decreasing toward the IR?
-            # Or is it small relative to the baseline?
-            gamma = 0.85 # IR suppression factor
-            is_suppressed = (kappa <= kappa_baseline * gamma) or (kappa < 0.2)
-            
-            eps = 0.001 
-            p_a = get_deformed_state_generic(L, H_sparse, [(sub_indices[0], eps)])
-            p_b = get_deformed_state_generic(L, H_sparse, [(sub_indices[-1], eps)])
-            p_ab = get_deformed_state_generic(L, H_sparse, [(sub_indices[0], eps), (sub_indices[-1], eps)])
-            
-            s0 = compute_entropy(psi0, sub_indices)
-            sa = compute_entropy(p_a, sub_indices)
-            sb = compute_entropy(p_b, sub_indices)
-            sab = compute_entropy(p_ab, sub_indices)
-            
-            chi = abs(sab - sa - sb + s0)
-            denom = (abs(sa-s0) + abs(sb-s0))
-            rel_chi = chi / denom if denom > 1e-10 else 0
-            
-            # Revised Semiclassical Gate
-            if rel_chi < 0.05 and is_suppressed:
-                admissible_l.append(l)
-        return admissible_l
+        if scales is None:
+            l_max = L//2 if H_sparse is not None else min(L//2, MPS_WINDOW_MAX_L)
+            scales = list(range(2, l_max + 1, 2))
+        scales = list(scales)
+        blocks = [list(range(L//2 - l//2, L//2 + l//2)) for l in scales]
+        kappa = [ModularDiagnostic.compute_cumulant_norm(compute_rho_sub(psi0, block), block) for block in blocks]
+        
+        tasks = [(L, H_sparse, psi0, block, eps, tuple(times), engine) for block in blocks for eps in epsilons]
+        # DMRG engines carry MPS environments: keep them in-process
+        columns = scan_map(_window_column, tasks, workers=1 if H_sparse is None else workers)
+        score = np.array(columns).reshape(len(scales), len(epsilons), len(times))
+        return WindowGrid(scales, epsilons, times, score, kappa, kappa_baseline)
+
+    @staticmethod
+    def get_admissible_scales(L, H_sparse, psi0, name, engine=None):
+        """
+        Scans block sizes l and calculates if they pass relative scaling criteria.
+        Uses IR-suppression logic (relative kappa) instead of absolute thresholds.
+        The (l, ε=0.001, t=0) slice of scan_window.
+        """
+        return AxiomExtractor.scan_window(L, H_sparse, psi0, name, engine=engine).admissible_scales()
 
 class StructuralConsistency:
     """
@@ -433,7 +898,7 @@ class StructuralConsistency:
     IPC: Information Positivity Constraint (delta <Hmod> >= delta S).
     """
     @staticmethod
-    def compute_residuals(L, H_sparse, psi0, l_size):
+    def compute_residuals(L, H_sparse, psi0, l_size, engine=None):
         """
         Measures the non-additive residual R.
         Only valid for linearized perturbations inside the semiclassical window.
@@ -442,9 +907,9 @@ class StructuralConsistency:
         sub_indices = list(range(L//2 - l_size//2, L//2 + l_size//2))
         eps = 0.001
         
-        p_a = get_deformed_state_generic(L, H_sparse, [(sub_indices[0], eps)])
-        p_b = get_deformed_state_generic(L, H_sparse, [(sub_indices[-1], eps)])
-        p_ab = get_deformed_state_generic(L, H_sparse, [(sub_indices[0], eps), (sub_indices[-1], eps)])
+        p_a = get_deformed_state_generic(L, H_sparse, [(sub_indices[0], eps)], psi_guess=psi0, engine=engine)
+        p_b = get_deformed_state_generic(L, H_sparse, [(sub_indices[-1], eps)], psi_guess=psi0, engine=engine)
+        p_ab = get_deformed_state_generic(L, H_sparse, [(sub_indices[0], eps), (sub_indices[-1], eps)], psi_guess=psi0, engine=engine)
         
         s0 = compute_entropy(psi0, sub_indices)
         sa = compute_entropy(p_a, sub_indices)
@@ -454,22 +919,17 @@ class StructuralConsistency:
         return abs(sab - sa - sb + s0)
 
     @staticmethod
-    def evaluate_ipc(L, H_sparse, psi0, sub_indices):
+    def evaluate_ipc(L, H_sparse, psi0, sub_indices, engine=None):
         """
         Verifies IPC strictly within W.
         delta <Hmod> >= delta S (Relative entropy positivity).
         """
-        rho_vac = compute_rho_sub(psi0, sub_indices)
-        evals, evecs = np.linalg.eigh(rho_vac)
-        evals = np.clip(evals, 1e-12, 1.0)
-        H_mod = -evecs @ np.diag(np.log(evals)) @ evecs.conj().T
+        ref = ModularReference.of(psi0, sub_indices, floor=1e-12)
         
         eps = 0.01
-        p_p = get_deformed_state_generic(L, H_sparse, [(sub_indices[0], eps)])
-        rho_p = compute_rho_sub(p_p, sub_indices)
-        
-        ds = compute_entropy(p_p, sub_indices) - compute_entropy(psi0, sub_indices)
-        dh = np.real(np.trace(rho_p @ H_mod)) - np.real(np.trace(rho_vac @ H_mod))
+        p_p = get_deformed_state_generic(L, H_sparse, [(sub_indices[0], eps)], psi_guess=psi0, engine=engine)
+        ds, dh, _ = ref.measure([p_p])
+        ds, dh = ds[0], dh[0]
         
         return dh >= (ds - 1e-9), dh - ds
 
@@ -492,62 +952,33 @@ def run_simulation(epsilon=0.0001, L=10):
     sub_len = L // 4
     sub_indices = list(range(sub_len))
     
-    # Trace out the rest to get rho_A
-    # Reuse compute_entropy logic for flattened rho
-    rest_indices = list(range(sub_len, L))
-    permuted = np.moveaxis(state, sub_indices, range(len(sub_indices)))
-    dim_a = 2**len(sub_indices)
-    dim_b = 2**len(rest_indices)
-    mat_a = permuted.reshape(dim_a, dim_b)
-    rho_orig = mat_a @ mat_a.conj().T
-    
-    eigvals, eigvecs = np.linalg.eigh(rho_orig)
-    eigvals = np.maximum(eigvals, 1e-15)
-    s_orig = -np.sum(eigvals * np.log(eigvals))
-    h_mod = -eigvecs @ np.diag(np.log(eigvals)) @ eigvecs.T.conj()
+    ref = ModularReference.of(state, sub_indices)
+    s_orig = ref.s0
     
     v_op = np.array([[0.5, 0.5], [0.5, -0.5]]) # Mixed probe
     
-    def get_delta_rho(eps):
-        # 1. Perturb state
+    def perturbed(eps):
         psi_p = state + eps * fast_perturb(state, v_op, 0)
-        psi_p /= np.linalg.norm(psi_p)
-        # 2. Get rho
-        pm = np.moveaxis(psi_p, sub_indices, range(len(sub_indices)))
-        ma = pm.reshape(dim_a, dim_b)
-        rho_p = ma @ ma.conj().T
-        # 3. Entropy
-        evs = np.linalg.eigvalsh(rho_p)
-        evs = evs[evs > 1e-15]
-        sp = -np.sum(evs * np.log(evs))
-        return sp, rho_p
-
-    # Symmetric differences
-    s_plus, rho_plus = get_delta_rho(epsilon)
-    s_minus, rho_minus = get_delta_rho(-epsilon)
-    
-    ds = (s_plus - s_minus) / 2
-    dr = (rho_plus - rho_minus) / 2
-    de = np.real(np.trace(dr @ h_mod))
+        return psi_p / np.linalg.norm(psi_p)
+
+    # Symmetric differences, both signs in one batch
+    dss, des, _ = ref.measure([perturbed(epsilon), perturbed(-epsilon)])
+    ds = (dss[0] - dss[1]) / 2
+    de = (des[0] - des[1]) / 2
     
     return s_orig, ds, de
 
 def visualize_metric_deform(L=10):
     state = get_ground_state(L)
     L_vis = min(L, 6)
-    mi_orig = np.zeros((L_vis, L_vis))
-    for i in range(L_vis):
-        for j in range(i+1, L_vis):
-            mi_orig[i, j] = compute_mutual_info(state, [i], [j])
+    # All-pairs MI in one batched pass; only the upper triangle is displayed
+    mi_orig = np.triu(mutual_info_matrix(state)[:L_vis, :L_vis], 1)
             
     v_op = np.array([[0, 1], [1, 0]]) # Pure flip perturbation
     state_p = state + 0.1 * fast_perturb(state, v_op, 0)
     state_p /= np.linalg.norm(state_p)
     
-    mi_pert = np.zeros((L_vis, L_vis))
-    for i in range(L_vis):
-        for j in range(i+1, L_vis):
-            mi_pert[i, j] = compute_mutual_info(state_p, [i], [j])
+    mi_pert = np.triu(mutual_info_matrix(state_p)[:L_vis, :L_vis], 1)
             
     # Masking for visual locality and numerical stability
     # Directed fix: Mask entries where MI < 10^-6 to restore visual locality
@@ -571,97 +1002,144 @@ def visualize_metric_deform(L=10):
             else: row += f"{delta_d[i,j]:+6.2f}"
         print(row)
 
-def get_deformed_state(L, sites_deltas, base_h=1.0):
+def get_deformed_state(L, sites_deltas, base_h=1.0, engine=None):
     """
     Phase 3/4: Multi-Site Hamiltonian Energy Proxy Insertion.
     sites_deltas: list of (site, delta_h) pairs.
+    engine: optional LinearResponseEngine of the base TFIM (perturbative instead of exact).
     """
     sites_str = ", ".join([f"{s}(δh={d})" for s, d in sites_deltas])
     print(f"[Phase 4] Inserting energy proxies at: {sites_str}")
     
-    sx = csr_matrix([[0, 1], [1, 0]])
-    id2 = identity(2)
-    id_chain = [id2] * L
+    if engine is not None:
+        psi, _ = engine.deformed_state(sites_deltas)
+        return psi
+    
+    cache_key = ('deformed', L, base_h, tuple(tuple(sd) for sd in sites_deltas))
+    cached = GLOBAL_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
     
     # Base Hamiltonian
     H_deform = setup_tfim_hamiltonian_fast(L, base_h)
     
     # Add localized deformations
     for site, delta_h in sites_deltas:
-        ops = id_chain[:]
-        ops[site] = sx
-        H_deform -= delta_h * reduce(kron, ops)
+        H_deform -= delta_h * assemble_csr(L, [(1.0, ((site, 'X'),))])
     
-    # Robust dense solver for L<=10
-    eigvals, eigvecs = np.linalg.eigh(H_deform.toarray())
-    psi = eigvecs[:, 0]
-    return psi.reshape(*(2 for _ in range(L)))
+    # Robust dense solver for L<=10; beyond that sparse, warm-started from the undeformed vacuum
+    def solve():
+        if L <= 10:
+            eigvals, eigvecs = np.linalg.eigh(H_deform.toarray())
+        else:
+            eigvals, eigvecs, _ = ContinuationSolver().solve(H_deform, get_ground_state(L, base_h))
+        return eigvals[0], eigvecs[:, 0]
+    params = {'h': base_h, 'deformations': [list(sd) for sd in sites_deltas]}
+    _, psi = SPECTRAL_STORE.ground_state('TFIM', L, params, solve, dtype=H_deform.dtype)
+    GLOBAL_CACHE[cache_key] = psi
+    return psi
+
+def _state_digest(state):
+    h = hashlib.sha256()
+    for arr in (state.tensors if isinstance(state, MPS) else [state]):
+        h.update(str(arr.shape).encode())
+        h.update(np.ascontiguousarray(arr).tobytes())
+    return h.hexdigest()
+
+class ModularReference:
+    """
+    Vacuum side of δS / δ<H_mod> / D(ρ_p || ρ_0) for one (state, region):
+    ρ_0, its spectrum, H_mod = -ln ρ_0 (eigenvalues floored at `floor`) and S_0, built once.
+    measure() handles a batch of perturbed states with one stacked eigvalsh.
+    """
+    def __init__(self, state0, indices, floor=1e-15):
+        self.indices = list(indices)
+        self.floor = floor
+        self.rho0 = compute_rho_sub(state0, indices)
+        ev0, es0 = np.linalg.eigh(self.rho0)
+        ev0 = np.maximum(ev0, floor)
+        self.spectrum = ev0
+        self.s0 = -np.sum(ev0 * np.log(ev0))
+        self.h_mod = -es0 @ np.diag(np.log(ev0)) @ es0.T.conj()
+        # <H_mod>_0 (equals S_0 up to the floor)
+        self.e0 = np.real(np.trace(self.rho0 @ self.h_mod))
+
+    @property
+    def nbytes(self):
+        # Budgeted by GLOBAL_CACHE
+        return self.rho0.nbytes + self.h_mod.nbytes + self.spectrum.nbytes
+
+    @classmethod
+    def of(cls, state0, indices, floor=1e-15):
+        """
+        Memoized per (state contents, region, floor) in GLOBAL_CACHE.
+        """
+        key = ('modular_ref', _state_digest(state0), tuple(indices), floor)
+        return GLOBAL_CACHE.get_or_compute(key, lambda: cls(state0, indices, floor))
+
+    def entropies(self, rhos):
+        evp = np.linalg.eigvalsh(rhos)
+        return -np.sum(np.where(evp > self.floor, evp * np.log(np.maximum(evp, self.floor)), 0.0), axis=-1)
+
+    def modular_energies(self, rhos):
+        return np.real(np.einsum('...ij,ji->...', rhos, self.h_mod))
+
+    def measure(self, states):
+        """
+        Returns arrays (δS, δ<H_mod>, D(ρ_p || ρ_0)), one entry per state.
+        """
+        rhos = np.stack([compute_rho_sub(st, self.indices) for st in states])
+        sp = self.entropies(rhos)
+        ep = self.modular_energies(rhos)
+        # D = -S_p - Tr(ρ_p ln ρ_0) = <H_mod>_p - S_p
+        return sp - self.s0, ep - self.e0, ep - sp
 
 def compute_relative_entropy(state_p, state0, indices):
     """
     D(rho_p || rho_0) = Tr(rho_p ln rho_p) - Tr(rho_p ln rho_0)
                       = -S(rho_p) - Tr(rho_p ln rho_0)
+    ln rho_0 comes from the cached ModularReference of (state0, indices).
     """
-    rho_p = compute_rho_sub(state_p, indices)
-    rho_0 = compute_rho_sub(state0, indices)
-    
-    # 1. -S(rho_p)
-    evp = np.linalg.eigvalsh(rho_p)
-    evp = evp[evp > 1e-15]
-    neg_s_p = np.sum(evp * np.log(evp))
-    
-    # 2. -Tr(rho_p ln rho_0)
-    ev0, es0 = np.linalg.eigh(rho_0)
-    ev0 = np.maximum(ev0, 1e-15)
-    ln_rho_0 = es0 @ np.diag(np.log(ev0)) @ es0.T.conj()
-    cross_term = -np.real(np.trace(rho_p @ ln_rho_0))
-    
-    return neg_s_p + cross_term
+    _, _, d = ModularReference.of(state0, indices).measure([state_p])
+    return d[0]
 
 def compute_rho_sub(state, indices):
     """
     Utility to get reduced density matrix for a subsystem.
     """
-    l = state.ndim
-    target_indices = sorted(indices)
-    permuted = np.moveaxis(state, target_indices, range(len(target_indices)))
-    dim_a = 2**len(target_indices)
-    ma = permuted.reshape(dim_a, -1)
+    if isinstance(state, MPS):
+        return state.reduced_density_matrix(indices)
+    ma = _subsystem_matrix(state, indices)
     return ma @ ma.conj().T
 
 def get_delta_s_and_de(state_p, state0, indices):
     """
-    Compute delta S and delta <H_mod> for a perturbation.
+    Compute delta S and delta <H_mod> for a perturbation (plus D(rho_p || rho_0)).
+    The vacuum eigendecomposition is shared through ModularReference.
     """
-    rho_p = compute_rho_sub(state_p, indices)
-    rho_0 = compute_rho_sub(state0, indices)
-    
-    # Original Eigendecomposition for H_mod
-    ev0, es0 = np.linalg.eigh(rho_0)
-    ev0 = np.maximum(ev0, 1e-15)
-    s0 = -np.sum(ev0 * np.log(ev0))
-    h_mod = -es0 @ np.diag(np.log(ev0)) @ es0.T.conj()
-    
-    # Perturbed Entropy
-    evp = np.linalg.eigvalsh(rho_p)
-    evp = evp[evp > 1e-15]
-    sp = -np.sum(evp * np.log(evp))
-    
-    ds = sp - s0
-    de = np.real(np.trace((rho_p - rho_0) @ h_mod))
-    
-    return ds, de, compute_relative_entropy(state_p, state0, indices)
+    ds, de, d = ModularReference.of(state0, indices).measure([state_p])
+    return ds[0], de[0], d[0]
 
-def run_phase_3_probes(L=8):
+def run_phase_3_probes(L=8, backend='exact'):
     print(f"\n[Phase 3] Kinematic Entanglement Structure Analysis (L={L})")
     print("Boundary Guard: All geometric language is kinematic/functional.")
     print("Notice: Observed deviations include finite-size and lattice artifacts.")
     print("=" * 60)
     
-    state0 = get_ground_state(L)
     insertion_site = 0
     delta_h = 0.2
-    state_p = get_deformed_state(L, [(insertion_site, delta_h)])
+    if backend == 'gaussian':
+        # Correlation-matrix path: the deformation -δh X_0 stays quadratic in Majoranas
+        g0 = GaussianTFIM(L)
+        gp = GaussianTFIM(L, sites_deltas=[(insertion_site, delta_h)])
+        entropy = lambda which, indices: (gp if which == 'p' else g0).entropy(indices)
+        rel_entropy = lambda indices: gp.relative_entropy(g0, indices)
+    else:
+        state0 = get_ground_state(L)
+        state_p = get_deformed_state(L, [(insertion_site, delta_h)])
+        profiles = {'0': entanglement_profile(state0)[1], 'p': entanglement_profile(state_p)[1]}
+        entropy = lambda which, indices: profiles[which][len(indices) - 1]
+        rel_entropy = lambda indices: compute_relative_entropy(state_p, state0, indices)
     
     print(f"\n[Diagnostic 1] Causal Diamond Interval Sweep (δS vs ℓ)")
     print(f"{'ℓ':>4} | {'δS':>10} | {'Rel Entropy D':>15} | {'D >= 0':>8}")
@@ -671,10 +1149,10 @@ def run_phase_3_probes(L=8):
     # Interval subsystems starting at site 0
     for l in range(1, L):
         indices = list(range(l))
-        s0 = compute_entropy(state0, indices)
-        sp = compute_entropy(state_p, indices)
+        s0 = entropy('0', indices)
+        sp = entropy('p', indices)
         ds = sp - s0
-        rel_ent = compute_relative_entropy(state_p, state0, indices)
+        rel_ent = rel_entropy(indices)
         results.append((l, ds, rel_ent))
         print(f"{l:4d} | {ds:+10.6f} | {rel_ent:15.8e} | {str(rel_ent > -1e-12):>8}")
 
@@ -685,30 +1163,27 @@ def run_phase_3_probes(L=8):
         if l in [2, 4, 6]:
             print(f"Interval ℓ={l} | δS: {ds:+.6f} | Stability D: {re:.4e}")
 
-def test_phase_4_superposition(L=8):
+def test_phase_4_superposition(L=8, perturbative=False):
     print(f"\n[Phase 4] Conditional Reconstruction: Superposition Test (L={L})")
     print("Semantic Lock: Reconstruction = Functional consistency class, not spacetime.")
     print("=" * 60)
     
     state0 = get_ground_state(L)
     sub_indices = list(range(2, 6)) # Central interval for overlap tests
+    # Perturbative mode: one diagonalization of H_0 serves every deformation below
+    engine = LinearResponseEngine(setup_tfim_hamiltonian_fast(L)) if perturbative else None
     
     # Perturbation sites
     site_a = 0
     site_b = 7 # Antipodal/Separated sites
     eps = 0.05 # Small perturbation for linearity
     
-    # 1. State A
-    state_a = get_deformed_state(L, [(site_a, eps)])
-    ds_a, de_a, d_a = get_delta_s_and_de(state_a, state0, sub_indices)
-    
-    # 2. State B
-    state_b = get_deformed_state(L, [(site_b, eps)])
-    ds_b, de_b, d_b = get_delta_s_and_de(state_b, state0, sub_indices)
-    
-    # 3. State A+B
-    state_ab = get_deformed_state(L, [(site_a, eps), (site_b, eps)])
-    ds_ab, de_ab, d_ab = get_delta_s_and_de(state_ab, state0, sub_indices)
+    # Vacuum modular data once; A, B and A+B measured in one batch
+    ref = ModularReference.of(state0, sub_indices)
+    state_a = get_deformed_state(L, [(site_a, eps)], engine=engine)
+    state_b = get_deformed_state(L, [(site_b, eps)], engine=engine)
+    state_ab = get_deformed_state(L, [(site_a, eps), (site_b, eps)], engine=engine)
+    (ds_a, ds_b, ds_ab), (de_a, de_b, de_ab), _ = ref.measure([state_a, state_b, state_ab])
     
     print(f"\n[Result] Linear Superposition Analysis")
     print(f"{'Quantity':>15} | {'Site A':>10} | {'Site B':>10} | {'Sum(A+B)':>10} | {'Actual(AB)':>10} | {'Residue':>8}")
@@ -725,15 +1200,15 @@ def test_phase_4_superposition(L=8):
     print(f"{'ε':>8} | {'Residue Chi':>12} | {'Relative Error':>15}")
     print("-" * 45)
     
-    for local_eps in [0.01, 0.05, 0.1, 0.2]:
-        s_a = get_deformed_state(L, [(site_a, local_eps)])
-        s_b = get_deformed_state(L, [(site_b, local_eps)])
-        s_ab = get_deformed_state(L, [(site_a, local_eps), (site_b, local_eps)])
-        
-        dsa, _, _ = get_delta_s_and_de(s_a, state0, sub_indices)
-        dsb, _, _ = get_delta_s_and_de(s_b, state0, sub_indices)
-        dsab, _, _ = get_delta_s_and_de(s_ab, state0, sub_indices)
-        
+    eps_values = [0.01, 0.05, 0.1, 0.2]
+    sweep_states = []
+    for local_eps in eps_values:
+        sweep_states += [get_deformed_state(L, [(site_a, local_eps)], engine=engine),
+                         get_deformed_state(L, [(site_b, local_eps)], engine=engine),
+                         get_deformed_state(L, [(site_a, local_eps), (site_b, local_eps)], engine=engine)]
+    sweep_ds, _, _ = ref.measure(sweep_states)
+    
+    for local_eps, (dsa, dsb, dsab) in zip(eps_values, sweep_ds.reshape(-1, 3)):
         residue = abs(dsab - (dsa + dsb))
         rel_err = residue / abs(dsab) if abs(dsab) > 1e-12 else 0
         print(f"{local_eps:8.2f} | {residue:12.6e} | {rel_err:15.2%}")
@@ -743,19 +1218,54 @@ def test_phase_4_superposition(L=8):
 class TimeEvolver:
     """
     Phase 6: Exact Unitary Evolution (Zero Trotter Error).
-    Uses dense matrix exponentiation for L=8 gold-standard verification.
+    eig=(w, v): evolve in the eigenbasis (SpectralPropagator, batched GEMM over times).
+    Otherwise sparse matrices and matrix-free LinearOperators go through KrylovPropagator
+    (Lanczos by default: norm-preserving by construction, which keeps the conservation
+    audit at roundoff), or ChebyshevPropagator with method='chebyshev' for long times.
+    No dense 2^L x 2^L propagator is formed.
     """
-    def __init__(self, H_sparse):
-        self.H = H_sparse.toarray() # Dense for precision
+    def __init__(self, H_sparse, eig=None, method='lanczos', tol=1e-12):
+        self.H = H_sparse
+        if eig is not None:
+            self.propagator = SpectralPropagator(*eig)
+        elif method == 'chebyshev':
+            self.propagator = ChebyshevPropagator(H_sparse, tol=min(tol, 1e-14))
+        else:
+            self.propagator = KrylovPropagator(H_sparse, method=method, tol=tol)
         
     def evolve(self, psi, t):
-        # Flatten for dense matmul
-        psi_flat = psi.reshape(-1)
-        # U(t) = expm(-iHt)
-        U = expm(-1j * t * self.H)
-        psi_new = U @ psi_flat
+        # U(t) psi = expm(-iHt) psi
+        _, psi_new = next(self.propagator.iter_evolve(psi.reshape(-1, 1), [t]))
         return psi_new.reshape(psi.shape)
 
+    def evolve_grid(self, states, times):
+        """
+        Yields (t, [evolved state tensors]) for a list of states along a time grid.
+        """
+        shape = states[0].shape
+        for t, block in self.propagator.iter_evolve(states, times):
+            yield t, [block[:, k].reshape(shape) for k in range(block.shape[1])]
+
+def additivity_error(states, sub_indices):
+    """
+    (χ, χ_rel) for evolved [ψ0, ψ_a, ψ_b, ψ_ab]: χ = |δS(AB) - δS(A) - δS(B)|,
+    χ_rel = χ / (|δS(A)| + |δS(B)|).
+    """
+    s0, sa, sb, sab = [compute_entropy(s, sub_indices) for s in states]
+    dsa, dsb, dsab = sa - s0, sb - s0, sab - s0
+    chi = abs(dsab - (dsa + dsb))
+    denom = abs(dsa) + abs(dsb)
+    return chi, (chi / denom if denom > 1e-9 else 0.0)
+
+def additivity_probe(evolver, states, sub_indices):
+    """
+    t -> χ_rel(t), evolving the four states straight from 0 to t (for CrossingSearch).
+    """
+    def probe(t):
+        _, evolved = next(evolver.evolve_grid(states, [t]))
+        return additivity_error(evolved, sub_indices)[1]
+    return probe
+
 def check_conservation(psi, H_dense, E0_opt):
     """
     Safeguard 1: Energy & Norm Conservation Check.
@@ -772,18 +1282,20 @@ def check_conservation(psi, H_dense, E0_opt):
     
     return norm, E, var
 
-def test_phase_6_dynamics(L=8):
+def test_phase_6_dynamics(L=8, t_max=4.0, backend='exact'):
+    """
+    backend='gaussian': the deformed TFIM states stay Gaussian under H_0, so they are
+    evolved as 2L x 2L Majorana correlation matrices (L = 500+); E-Var from Wick's theorem.
+    """
     print(f"\n[Phase 6] Time & Dynamics: Unitary Evolution Probes (L={L})")
     print("Scope: Pure Physics. Zero Metaphysics. Unitary Flow Only.")
-    print("Evolution: Exact Dense Exponentiation (No Trotter Error).")
+    if backend == 'gaussian':
+        mode = "Gaussian (Correlation-Matrix)"
+    else:
+        mode = "Eigenbasis" if L <= SPECTRAL_EVOLUTION_MAX_L else "Chebyshev"
+    print(f"Evolution: Exact {mode} Exponentiation (No Trotter Error).")
     print("=" * 60)
     
-    # 1. Setup System
-    H_sparse = setup_tfim_hamiltonian_fast(L, h=1.0)
-    H_dense = H_sparse.toarray()
-    
-    # 2. Prepare States
-    state0 = get_ground_state(L)
     sub_indices = list(range(2, 6)) # Central interval for causal check
     
     # Perturbations
@@ -791,46 +1303,42 @@ def test_phase_6_dynamics(L=8):
     site_b = L - 1 # Separated
     eps = 0.05
     
-    # Initial Deformed States
-    psi_a_0 = get_deformed_state(L, [(site_a, eps)])
-    psi_b_0 = get_deformed_state(L, [(site_b, eps)])
-    psi_ab_0 = get_deformed_state(L, [(site_a, eps), (site_b, eps)])
+    if backend == 'gaussian':
+        A0 = majorana_hamiltonian(L, h=1.0)
+        evolver = GaussianQuench(A0)
+        state0, psi_a_0, psi_b_0, psi_ab_0 = [GaussianState(GaussianTFIM(L, h=1.0, sites_deltas=sd).Gamma)
+                                               for sd in ([], [(site_a, eps)], [(site_b, eps)], [(site_a, eps), (site_b, eps)])]
+        conservation = lambda psi: psi.energy_variance(A0)
+    else:
+        # 1. Setup System
+        H_sparse = setup_tfim_hamiltonian_fast(L, h=1.0)
+        
+        # 2. Prepare States
+        state0 = get_ground_state(L)
+        
+        # Initial Deformed States
+        psi_a_0 = get_deformed_state(L, [(site_a, eps)])
+        psi_b_0 = get_deformed_state(L, [(site_b, eps)])
+        psi_ab_0 = get_deformed_state(L, [(site_a, eps), (site_b, eps)])
     
     # Trackers
-    times = np.linspace(0, 4.0, 9) # dt = 0.5
+    times = np.linspace(0, t_max, int(round(t_max / 0.5)) + 1) # dt = 0.5
     
-    print(f"\n[Run] Evolving 4 states under H_0 for t=[0, 4.0]...")
+    print(f"\n[Run] Evolving 4 states under H_0 for t=[0, {t_max}]...")
     print(f"{'t':>4} | {'δS(A)':>9} | {'δS(B)':>9} | {'δS(AB)':>9} | {'Lin Error χ':>11} | {'Rel Err %':>9} | {'E-Var':>8}")
     print("-" * 75)
     
-    current_0 = state0
-    current_a = psi_a_0
-    current_b = psi_b_0
-    current_ab = psi_ab_0
-    
-    # Pre-compute E0 for reference
-    _, E0, _ = check_conservation(state0, H_dense, 0)
-    
-    for t in times:
-        if t > 0:
-            # Evolve step-by-step
-            dt = times[1] - times[0]
-            U_dt = expm(-1j * dt * H_dense)
-            
-            # Helper to evolve tensor state
-            def evolve_step(state, U):
-                shape = state.shape
-                flat = state.reshape(-1)
-                new_flat = U @ flat
-                return new_flat.reshape(shape)
-                
-            current_0 = evolve_step(current_0, U_dt)
-            current_a = evolve_step(current_a, U_dt)
-            current_b = evolve_step(current_b, U_dt)
-            current_ab = evolve_step(current_ab, U_dt)
-            
+    if backend != 'gaussian':
+        # Pre-compute E0 for reference
+        _, E0, _ = check_conservation(state0, H_sparse, 0)
+        conservation = lambda psi: check_conservation(psi, H_sparse, E0)[2]
+        
+        # The four states evolve as one block: eigenbasis GEMMs at small L, Chebyshev steps beyond
+        eig = get_model_spectrum('TFIM', L, H_sparse, h=1.0) if L <= SPECTRAL_EVOLUTION_MAX_L else None
+        evolver = TimeEvolver(H_sparse, eig=eig, method='chebyshev')
+    for t, (current_0, current_a, current_b, current_ab) in evolver.evolve_grid([state0, psi_a_0, psi_b_0, psi_ab_0], times):
         # Conservation Check
-        norm, E, var = check_conservation(current_0, H_dense, E0)
+        var = conservation(current_0)
         
         # Measurements (Entropy relative to EVOLVED vacuum)
         s0 = compute_entropy(current_0, sub_indices)
@@ -854,9 +1362,22 @@ def test_phase_6_dynamics(L=8):
         print(f"{t:4.1f} | {dsa:9.6f} | {dsb:9.6f} | {dsab:9.6f} | {chi:11.6e} | {rel_err*100:8.2f}% | {var:8.1e}{pass_mark}")
 
     print("-" * 75)
+    if backend != 'gaussian':
+        # The quench never leaves the Gaussian manifold: certify the final evolved state
+        report = WickAuditor(current_ab).audit(n_samples=None if L <= 12 else 2000)
+        print(f"Wick Audit ψ_AB(t={t_max}): |Γ^TΓ - 1| = {report['purity']:.1e}, 4-point = {report['wick_4']:.1e}")
     print("Interpretation: Linearity survives short times, then breaks down as entanglement scrambles.")
 
-def run_universality_scan(L=8):
+def run_universality_scan(L=8, perturbative=False, t_max=3.0, tol=1e-2, backend='exact', chi_max=64, trotter_order=4,
+                          sub_indices=None, deform_sites=None):
+    """
+    backend='tebd': open-chain DMRG ground states evolved by TEBD (L = 50-100);
+    backend='gaussian': TFIM row only, as Majorana correlation matrices (L = 500+).
+    sub_indices defaults to sites 2..5; deform_sites (a, b) to two sites either side of
+    it (0 and L-1 at L=8), so the block sits inside both light cones on an open chain too.
+    """
+    sub_indices = list(range(2, 6)) if sub_indices is None else list(sub_indices)
+    a, b = (max(sub_indices[0] - 2, 0), min(sub_indices[-1] + 2, L - 1)) if deform_sites is None else deform_sites
     print(f"\n[Phase 7] Comparative Dynamics: Universality Scan (L={L})", flush=True)
     print("Director's Objective: Is linearity breakdown generic or model-dependent?", flush=True)
     print("Diagnostic: 'Modular Chaos' -> Rate of linearity error growth.", flush=True)
@@ -867,77 +1388,77 @@ def run_universality_scan(L=8):
         ('XXZ', {'delta': 0.5}, "Interacting Integrable"),
         ('Chaotic', {'h': 1.0, 'g': 0.5}, "Non-Integrable (Scrambler)")
     ]
+    if backend == 'gaussian':
+        # Only the free-fermion model stays Gaussian under the quench
+        models = [m for m in models if m[0] == 'TFIM']
     
     results_summary = []
     
     for name, params, desc in models:
         print(f"\n>>> Model: {name} {params} [{desc}]", flush=True)
-        H_sparse = HamiltonianFactory.create(name, L, **params)
-        H_dense = H_sparse.toarray()
         
         # --- Dynamics Loop (Condensed) ---
         # Note: Ground state depends on FACTORY creation in real run
         # Correction: Need to get ground state OF THE NEW HAMILTONIAN
         # Re-using logic manually here for clarity and factory usage
         print(f"[Compute] Solving Ground State for {name}...", flush=True)
-        w, v = np.linalg.eigh(H_dense)
-        psi0 = v[:, 0].reshape(*(2 for _ in range(L)))
-        E0 = w[0]
+        if backend == 'gaussian':
+            H_sparse, psi0, engine = None, GaussianState(GaussianTFIM(L, **params).Gamma), None
+        elif backend == 'tebd':
+            H_sparse, psi0, engine = get_model_backend(name, L, params, 'dmrg', chi_max=chi_max)
+        else:
+            H_sparse = HamiltonianFactory.create(name, L, **params)
+            psi0 = get_model_ground_state(name, L, H_sparse, **params)
+            engine = LinearResponseEngine(H_sparse) if perturbative else None
         
         # Perturbations
-        sub_indices = list(range(2, 6))
         eps = 0.05
-        psi_a = get_deformed_state_generic(L, H_sparse, [(0, eps)])
-        psi_b = get_deformed_state_generic(L, H_sparse, [(L-1, eps)])
-        psi_ab = get_deformed_state_generic(L, H_sparse, [(0, eps), (L-1, eps)])
-        
-        times = np.linspace(0, 3.0, 7) # 0.5 steps
+        if backend == 'gaussian':
+            psi_a, psi_b, psi_ab = [GaussianState(GaussianTFIM(L, sites_deltas=sd, **params).Gamma)
+                                    for sd in ([(a, eps)], [(b, eps)], [(a, eps), (b, eps)])]
+        else:
+            psi_a = get_deformed_state_generic(L, H_sparse, [(a, eps)], psi_guess=psi0, engine=engine)
+            psi_b = get_deformed_state_generic(L, H_sparse, [(b, eps)], psi_guess=psi0, engine=engine)
+            psi_ab = get_deformed_state_generic(L, H_sparse, [(a, eps), (b, eps)], psi_guess=psi0, engine=engine)
         
-        tau_onset = ">3.0"
-        tau_breakdown = ">3.0"
+        times = np.linspace(0, t_max, int(round(t_max / 0.5)) + 1) # 0.5 steps
         
         print(f"{'t':>4} | {'Lin Error χ':>11} | {'Rel Err %':>9}", flush=True)
         print("-" * 35, flush=True)
         
-        for t in times:
-            U = expm(-1j * t * H_dense)
-            
-            # Helper
-            def evo(st): return (U @ st.reshape(-1)).reshape(st.shape)
-            
-            p0_t = evo(psi0)
-            pa_t = evo(psi_a)
-            pb_t = evo(psi_b)
-            pab_t = evo(psi_ab)
-            
-            s0 = compute_entropy(p0_t, sub_indices)
-            sa = compute_entropy(pa_t, sub_indices)
-            sb = compute_entropy(pb_t, sub_indices)
-            sab = compute_entropy(pab_t, sub_indices)
-            
-            dsa = sa - s0
-            dsb = sb - s0
-            dsab = sab - s0
-            
-            chi = abs(dsab - (dsa + dsb))
-            denom = abs(dsa) + abs(dsb)
-            rel = chi / denom if denom > 1e-9 else 0
-            
-            # Threshold Check
-            if rel > 0.05 and tau_onset == ">3.0": tau_onset = f"{t:.1f}"
-            if rel > 0.10 and tau_breakdown == ">3.0": tau_breakdown = f"{t:.1f}"
-            
+        # One sweep over the grid for all four states (no dense expm per time)
+        states = [psi0, psi_a, psi_b, psi_ab]
+        if backend == 'gaussian':
+            evolver = GaussianQuench(majorana_hamiltonian(L, **params))
+        elif backend == 'tebd':
+            evolver = TEBDEvolver(name, L, order=trotter_order, chi_max=chi_max, **params)
+        else:
+            eig = get_model_spectrum(name, L, H_sparse, **params) if L <= SPECTRAL_EVOLUTION_MAX_L else None
+            evolver = TimeEvolver(H_sparse, eig=eig, method='chebyshev')
+        search = CrossingSearch(additivity_probe(evolver, states, sub_indices), t_max,
+                                n_coarse=len(times), xtol=tol)
+        for t, evolved in evolver.evolve_grid(states, times):
+            chi, rel = additivity_error(evolved, sub_indices)
+            # The grid doubles as the coarse bracketing scan
+            search.values[float(t)] = rel
             print(f"{t:4.1f} | {chi:11.6e} | {rel*100:8.2f}%", flush=True)
-            
-        results_summary.append((name, tau_onset, tau_breakdown))
+        if backend == 'tebd':
+            print(f"[TEBD] order={trotter_order}, max χ={evolver.max_bond}, "
+                  f"discarded weight={evolver.truncation:.2e} (worst state)", flush=True)
+        
+        # Threshold crossings refined between grid points
+        taus = search.scan([0.05, 0.10])
+        tau_onset, tau_breakdown = [f">{t_max}" if taus[thr] is None else f"{taus[thr]:.2f}" for thr in (0.05, 0.10)]
+        
+        results_summary.append((name, tau_onset, tau_breakdown, search.n_evals))
         
     print("\n[Phase 7 Summary] Universality Diagnostic Table", flush=True)
-    print(f"{'Model':>10} | {'τ_onset (5%)':>15} | {'τ_break (10%)':>15}", flush=True)
-    print("-" * 45, flush=True)
+    print(f"{'Model':>10} | {'τ_onset (5%)':>15} | {'τ_break (10%)':>15} | {'Evals':>5}", flush=True)
+    print("-" * 53, flush=True)
     for res in results_summary:
-        print(f"{res[0]:>10} | {res[1]:>15} | {res[2]:>15}", flush=True)
+        print(f"{res[0]:>10} | {res[1]:>15} | {res[2]:>15} | {res[3]:>5}", flush=True)
 
-def run_phase_8_classification(L=8):
+def run_phase_8_classification(L=8, perturbative=False, backend='exact', chi_max=64, n_disorder=8, disorder=0.5):
     print(f"\n[Phase 8] Modular Locality Classification (L={L})", flush=True)
     print("Objective: Correlate Linearity Breakdown (χ) with Non-Gaussianity (Δ_Wick).", flush=True)
     print("Director's Theorem: Linear response requires approximate modular locality.", flush=True)
@@ -954,10 +1475,7 @@ def run_phase_8_classification(L=8):
     
     for name, params, desc in models:
         print(f"\n>>> Analyzing {name} [{desc}]...", flush=True)
-        H_sparse = HamiltonianFactory.create(name, L, **params)
-        H_dense = H_sparse.toarray()
-        w, v = np.linalg.eigh(H_dense)
-        psi0 = v[:, 0].reshape(*(2 for _ in range(L)))
+        H_sparse, psi0, engine = get_model_backend(name, L, params, backend, perturbative, chi_max)
         
         rho = compute_rho_sub(psi0, sub_indices)
         
@@ -967,14 +1485,27 @@ def run_phase_8_classification(L=8):
         
         # Diagnostic B: Entanglement Spectrum
         print(f"[Phase 8] Analyzing Entanglement Spectrum...", flush=True)
-        avg_r, _ = EntanglementSpectrumAnalyzer.analyze(rho)
+        # A translated block has the same spectrum: one block per size, pooled over
+        # bond-disorder realizations next to the clean state; disorder strong enough that
+        # realizations are not near-copies of the clean spectrum (independent sources)
+        blocks = [sub_indices[:l] for l in range(3, len(sub_indices) + 1)]
+        states = [psi0] if H_sparse is None else \
+            [psi0] + [get_disordered_state(L, H_sparse, strength=disorder, seed=seed, psi_guess=psi0)
+                      for seed in range(n_disorder)]
+        avg_r, r_line = EntanglementSpectrumAnalyzer.summarize(
+            EntanglementSpectrumAnalyzer.analyze_pooled(states, blocks), "states")
+        # Sector-resolved energy spectra need the full (exact) Hamiltonian
+        e_r, e_line = (np.nan, "skipped (needs the exact Hamiltonian)") if H_sparse is None else \
+            EntanglementSpectrumAnalyzer.summarize(EntanglementSpectrumAnalyzer.energy_pooled(H_sparse, L), "sectors")
         
         # Reference Phase 7 Linearity Error (Instantaneous t=0)
-        # We simulate a tiny perturbation to get χ
+        # We simulate a tiny perturbation to get χ, two sites either side of the block
+        # (sites 0 and L-1 at L=8; on an open MPS chain the block's own neighbourhood)
         eps = 0.01
-        p_a = get_deformed_state_generic(L, H_sparse, [(0, eps)])
-        p_b = get_deformed_state_generic(L, H_sparse, [(L-1, eps)])
-        p_ab = get_deformed_state_generic(L, H_sparse, [(0, eps), (L-1, eps)])
+        a, b = sub_indices[0] - 2, sub_indices[-1] + 2
+        p_a = get_deformed_state_generic(L, H_sparse, [(a, eps)], psi_guess=psi0, engine=engine)
+        p_b = get_deformed_state_generic(L, H_sparse, [(b, eps)], psi_guess=psi0, engine=engine)
+        p_ab = get_deformed_state_generic(L, H_sparse, [(a, eps), (b, eps)], psi_guess=psi0, engine=engine)
         
         s0 = compute_entropy(psi0, sub_indices)
         sa = compute_entropy(p_a, sub_indices)
@@ -984,22 +1515,24 @@ def run_phase_8_classification(L=8):
         chi = abs(sab - sa - sb + s0) # Delta(Chi) = |dS_ab - (dS_a + dS_b)|
         rel_chi = chi / (abs(sa-s0) + abs(sb-s0)) if abs(sa-s0) > 1e-9 else 0
         
-        summary.append((name, kappa_norm, avg_r, rel_chi))
+        summary.append((name, kappa_norm, avg_r, e_r, rel_chi))
         print(f"Modular Non-Gaussianity (κ4_mod): {kappa_norm:.6f} (Proxy Norm)", flush=True)
-        print(f"Spectrum r_n ratio:            {avg_r:.4f} (Poisson~0.38, WD~0.53)", flush=True)
+        print(f"Spectrum r_n ratio:            {r_line}", flush=True)
+        print(f"Energy r_n (sector-resolved):  {e_line}", flush=True)
         print(f"Linearity Error (χ_rel):       {rel_chi:.4f}", flush=True)
 
     print("\n[Phase 8 Summary] Structural Classification Table", flush=True)
-    print(f"{'Model':>10} | {'κ4_mod (Proxy)':>14} | {'Symmetry r_n':>12} | {'Lin Error χ':>12}", flush=True)
-    print("-" * 60, flush=True)
+    print(f"{'Model':>10} | {'κ4_mod (Proxy)':>14} | {'Symmetry r_n':>12} | {'Energy r_n':>10} | {'Lin Error χ':>12}", flush=True)
+    print("-" * 73, flush=True)
     for s in summary:
-        print(f"{s[0]:>10} | {s[1]:14.6f} | {s[2]:12.4f} | {s[3]:12.4f}", flush=True)
+        r_cols = [f"{v:{w}.4f}" if np.isfinite(v) else f"{'n/a':>{w}}" for v, w in ((s[2], 12), (s[3], 10))]
+        print(f"{s[0]:>10} | {s[1]:14.6f} | {r_cols[0]} | {r_cols[1]} | {s[4]:12.4f}", flush=True)
     
     print("\nCaveat: κ4_mod tracks modular non-Gaussianity, not global Wick violation.", flush=True)
     print("Result: High κ4_mod (Modular Non-Gaussianity) correlates with high Linearity Error.", flush=True)
     print("Conclusion: Functional locality requires modular Gaussianity.", flush=True)
 
-def run_phase_9_linear_response(L=8):
+def run_phase_9_linear_response(L=8, perturbative=False):
     print(f"\n[Phase 9] Necessary Conditions for Stable Linear Response (L={L})", flush=True)
     print("Objective: Why does the additive regime exist? (Resolution & Stability)", flush=True)
     print("Disclaimer: Result tracks Modular Mixing (connected cumulants), not global Wick violation.", flush=True)
@@ -1008,21 +1541,24 @@ def run_phase_9_linear_response(L=8):
     # 1. Energy-Gaussianity Correlation (Modular Protection)
     print("\n>>> Resolution Logic: Spectral Gap vs. Modular Correlator Norm", flush=True)
     h_vals = [0.5, 1.0, 1.5] # Through critical point h=1.0
-    print(f"{'h (TFIM)':>10} | {'Gap ΔE':>10} | {'ModNorm (Proxy)':>15}", flush=True)
-    for h in h_vals:
-        H_sparse = HamiltonianFactory.create('TFIM', L, h=h)
-        w, v = np.linalg.eigh(H_sparse.toarray())
+    # Continuation along h: each point is warm-started from the previous ground state
+    solver = ContinuationSolver(k=2)
+    path = SPECTRAL_STORE.fetch('TFIM', L, {'h_path': h_vals, 'k': 2}, 'continuation',
+                                lambda: solver.sweep(lambda h: HamiltonianFactory.create('TFIM', L, h=h), h_vals))
+    print(f"{'h (TFIM)':>10} | {'Gap ΔE':>10} | {'ModNorm (Proxy)':>15} | {'χ_F/L':>10} | {'Matvecs':>7}", flush=True)
+    for i, h in enumerate(h_vals):
+        w = path['eigvals'][i]
         gap = w[1] - w[0]
-        psi0 = v[:, 0].reshape(*(2 for _ in range(L)))
+        psi0 = path['ground'][i].reshape(*(2 for _ in range(L)))
         rho = compute_rho_sub(psi0, list(range(2,6)))
         kappa = ModularDiagnostic.compute_cumulant_norm(rho, list(range(2,6)))
-        print(f"{h:10.2f} | {gap:10.6f} | {kappa:15.6f}", flush=True)
+        print(f"{h:10.2f} | {gap:10.6f} | {kappa:15.6f} | {path['chi_F'][i]/L:10.4f} | {path['matvecs'][i]:7d}", flush=True)
 
     # 2. Resolution Flow (Bounds of Correlator Norm)
     print("\n>>> Scale Analysis: Resolution Flow of ModNorm", flush=True)
     name, params = 'TFIM', {'h': 1.0}
     H_sparse = HamiltonianFactory.create(name, L, **params)
-    w, v = np.linalg.eigh(H_sparse.toarray())
+    w, v = get_model_spectrum(name, L, H_sparse, **params)
     psi0 = v[:, 0].reshape(*(2 for _ in range(L)))
     
     site_groups = [list(range(2,4)), list(range(2,6))] # Block size 2 and 4
@@ -1034,20 +1570,22 @@ def run_phase_9_linear_response(L=8):
     # 3. Additivity Lifetime (τ_add)
     print("\n>>> Stability: Additivity Lifetime (τ_add)", flush=True)
     models = [('TFIM', {'h': 1.0}), ('Chaotic', {'h': 1.0, 'g': 0.5})]
-    print(f"{'Model':>10} | {'τ_add (10%)':>12}", flush=True)
+    print(f"{'Model':>10} | {'τ_add (10%)':>12} | {'Evals':>5}", flush=True)
     for n, p in models:
         H_sparse = HamiltonianFactory.create(n, L, **p)
-        w, v = np.linalg.eigh(H_sparse.toarray())
+        w, v = get_model_spectrum(n, L, H_sparse, **p)
         psi0 = v[:, 0].reshape(*(2 for _ in range(L)))
-        t_add = StabilityAnalyzer.compute_tau_add(n, H_sparse, psi0, list(range(2,6)))
-        print(f"{n:>10} | {t_add:>12}", flush=True)
+        engine = LinearResponseEngine(H_sparse, w, v) if perturbative else None
+        t_add, n_evals = StabilityAnalyzer.compute_tau_add(n, H_sparse, psi0, list(range(2,6)), eig=(w, v), engine=engine)
+        print(f"{n:>10} | {t_add:>12} | {n_evals:>5}", flush=True)
         
     print("3. τ_add (Additivity Lifetime) is the operational boundary of response.", flush=True)
 
-def run_phase_10_compatibility(L):
+def run_phase_10_compatibility(L, perturbative=False, backend='exact', chi_max=64):
     """
     Director's Gate: Structural Compatibility Analysis.
     Performs Axiom Extraction and Residual Mapping for TFIM vs XXZ.
+    backend='dmrg' runs on open-chain MPS ground states (L = 40-100).
     """
     print("\n" + "="*60)
     print(" PHASE 10: STRUCTURAL COMPATIBILITY ANALYSIS (Director's Gate) ")
@@ -1060,15 +1598,24 @@ def run_phase_10_compatibility(L):
     
     for name, params, desc in models:
         print(f"\n>>> Analyzing Model: {name} ({desc})")
-        H_sparse = HamiltonianFactory.create(name, L, **params)
-        w, v = np.linalg.eigh(H_sparse.toarray())
-        psi0 = v[:, 0].reshape(*(2 for _ in range(L)))
+        H_sparse, psi0, engine = get_model_backend(name, L, params, backend, perturbative, chi_max)
         
         # 1. Axiom Extraction (Window W)
         print(f"--- 1. Axiom Extraction (Semiclassical Window W) ---")
-        admissible_l = AxiomExtractor.get_admissible_scales(L, H_sparse, psi0, name)
+        # ε = 0.001, t = 0 is the linear-response slice the gate was defined on
+        times = (0.0, 1.0, 2.0) if H_sparse is not None else (0.0,)
+        grid = AxiomExtractor.scan_window(L, H_sparse, psi0, name, epsilons=(0.001, 0.01, 0.05), times=times, engine=engine)
+        admissible_l = grid.admissible_scales()
+        components = grid.components()
+        print(f"Window grid (l x ε x t = {' x '.join(map(str, grid.mask.shape))}): "
+              f"{int(grid.mask.sum())}/{grid.mask.size} admissible cells, {len(components)} component(s)")
+        for comp in components[:3]:
+            cells = np.array(grid.cells(comp))
+            print(f"  component: l in [{cells[:, 0].min():g}, {cells[:, 0].max():g}], "
+                  f"ε in [{cells[:, 1].min():g}, {cells[:, 1].max():g}], t in [{cells[:, 2].min():g}, {cells[:, 2].max():g}]")
         if not admissible_l:
-            print(f"Result: W is EMPTY. (No scales satisfy χ < 0.05 and κ < 0.15).")
+            print(f"Result: W is EMPTY. (No scales satisfy χ < {grid.chi_tol:g} and "
+                  f"κ4 < {grid.kappa_floor:g} or κ4 <= {grid.gamma:g} κ4(l=2)).")
         else:
             print(f"Result: W admits scales l = {admissible_l}")
             
@@ -1077,14 +1624,14 @@ def run_phase_10_compatibility(L):
         print(f"{'Scale l':>8} | {'Residual R':>12}")
         for l in [2, 4, 6]:
             if l > L: continue
-            res = StructuralConsistency.compute_residuals(L, H_sparse, psi0, l)
+            res = StructuralConsistency.compute_residuals(L, H_sparse, psi0, l, engine=engine)
             print(f"{l:8d} | {res:12.6f}")
             
         # 3. IPC Verification (strictly within Window)
         if admissible_l:
             l_target = admissible_l[0]
             sub_indices = list(range(L//2 - l_target//2, L//2 + l_target//2))
-            passed, deficiency = StructuralConsistency.evaluate_ipc(L, H_sparse, psi0, sub_indices)
+            passed, deficiency = StructuralConsistency.evaluate_ipc(L, H_sparse, psi0, sub_indices, engine=engine)
             print(f"--- 3. IPC (Information Positivity Constraint) ---")
             print(f"Result: {'PASSED' if passed else 'FAILED'} (Deficiency: {deficiency:.2e})")
             print(f"Logic: Information-Theoretic Positivity holds at scale l={l_target}.")
@@ -1099,17 +1646,89 @@ def run_phase_10_compatibility(L):
     print(" 3. Final Verdict: Semiclassicality is a Structural Privilege, not a generic QM property.")
     print("="*60)
 
-def get_deformed_state_generic(L, H_sparse, sites_deltas):
+def get_model_spectrum(name, L, H_sparse, **params):
+    """
+    Full eigendecomposition (w, v) through SPECTRAL_STORE; TFIM via symmetry blocks.
+    """
+    if name == 'TFIM':
+        solver = lambda: symmetric_full_eigh(name, L, **params)
+    else:
+        solver = lambda: np.linalg.eigh(H_sparse.toarray())
+    return SPECTRAL_STORE.spectrum(name, L, params, solver, dtype=H_sparse.dtype)
+
+def get_model_backend(name, L, params, backend='exact', perturbative=False, chi_max=64):
+    """
+    (H_sparse, psi0, engine) for Phases 8/10.
+    backend='dmrg': no sparse H; psi0 is an MPS and the engine is a DMRGEngine, whose
+    deformed states flow through get_deformed_state_generic like LinearResponseEngine's.
+    """
+    if backend == 'dmrg':
+        cache_key = ('dmrg', name, L, tuple(sorted(params.items())), chi_max)
+        engine = GLOBAL_CACHE.get(cache_key)
+        if engine is None:
+            engine = DMRGEngine(name, L, chi_max=chi_max, **params)
+            engine.ground_state()
+            # Charged by engine.nbytes; re-charged on each hit as deformed MPS accumulate
+            GLOBAL_CACHE[cache_key] = engine
+        return None, engine.ground_state(), engine
+    H_sparse = HamiltonianFactory.create(name, L, **params)
+    psi0 = get_model_ground_state(name, L, H_sparse, **params)
+    engine = LinearResponseEngine(H_sparse) if perturbative else None
+    return H_sparse, psi0, engine
+
+def get_disordered_state(L, H_sparse, strength=0.1, seed=0, psi_guess=None):
+    """
+    Ground state of H + Σ_i δ_i Z_i Z_{i+1} (periodic bonds, δ_i uniform in [-strength, strength]).
+    Bond disorder keeps S^z and spin-flip symmetry, so a realization is an independent
+    sample with the clean model's local sectors; translation and reflection are broken.
+    """
+    rng = np.random.default_rng(seed)
+    deltas = np.round(rng.uniform(-strength, strength, L), 12)
+    digest = hamiltonian_digest(H_sparse)
+    cache_key = ('disordered', digest, tuple(deltas))
+    cached = GLOBAL_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    H_mod = H_sparse + assemble_csr(L, [(d, ((i, 'Z'), ((i + 1) % L, 'Z'))) for i, d in enumerate(deltas)])
+    def solve():
+        if L <= 10:
+            w, v = np.linalg.eigh(H_mod.toarray())
+        else:
+            w, v, _ = ContinuationSolver().solve(H_mod, psi_guess)
+        return w[0], v[:, 0]
+    params = {'H': digest, 'bonds': deltas.tolist()}
+    _, psi = SPECTRAL_STORE.ground_state('disordered', L, params, solve, dtype=H_mod.dtype)
+    GLOBAL_CACHE[cache_key] = psi
+    return psi
+
+def get_deformed_state_generic(L, H_sparse, sites_deltas, psi_guess=None, engine=None):
     # Helper for arbitrary Hamiltonians
-    sx = csr_matrix([[0, 1], [1, 0]])
-    id_chain = [identity(2)] * L
+    # psi_guess: nearby (e.g. undeformed) ground state, warm-starts the sparse solver for L > 10
+    # engine: LinearResponseEngine of H_sparse; one spectral decomposition serves all deformations
+    if engine is not None:
+        psi, _ = engine.deformed_state(sites_deltas)
+        return psi
+    
+    digest = hamiltonian_digest(H_sparse)
+    cache_key = ('deformed', digest, tuple(tuple(sd) for sd in sites_deltas))
+    cached = GLOBAL_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
     H_mod = H_sparse.copy()
     for site, d in sites_deltas:
-        ops = id_chain[:]
-        ops[site] = sx
-        H_mod -= d * reduce(kron, ops)
-    w, v = np.linalg.eigh(H_mod.toarray())
-    return v[:, 0].reshape(*(2 for _ in range(L)))
+        H_mod -= d * assemble_csr(L, [(1.0, ((site, 'X'),))])
+    def solve():
+        if L <= 10:
+            w, v = np.linalg.eigh(H_mod.toarray())
+        else:
+            w, v, _ = ContinuationSolver().solve(H_mod, psi_guess)
+        return w[0], v[:, 0]
+    params = {'H': digest, 'deformations': [list(sd) for sd in sites_deltas]}
+    _, psi = SPECTRAL_STORE.ground_state('deformed', L, params, solve, dtype=H_mod.dtype)
+    GLOBAL_CACHE[cache_key] = psi
+    return psi
 
 
 
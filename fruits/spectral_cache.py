@@ -0,0 +1,280 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+from collections import OrderedDict
+
+"""
+spectral_cache.py — Persistent Store for Ground States & Spectra
+Content-addressed on-disk entries keyed by (model, L, params, boundary, dtype, kind).
+Each entry is a directory of .npy arrays (memory-mapped on load) plus meta.json.
+Bumping STORE_VERSION invalidates every existing entry.
+ByteBudgetCache is the bounded in-process tier in front of it.
+"""
+
+STORE_VERSION = 1
+DEFAULT_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "science-scripture", "spectra")
+
+def hamiltonian_digest(H):
+    """
+    Content hash of a sparse Hamiltonian, for entries that have no model name
+    (e.g. deformed Hamiltonians built on the fly).
+    """
+    H = H.tocsr()
+    if not H.has_sorted_indices:
+        H = H.sorted_indices()
+    h = hashlib.sha256()
+    h.update(str((H.shape, H.dtype.str)).encode())
+    for arr in (H.indptr, H.indices, H.data):
+        h.update(np.ascontiguousarray(arr).tobytes())
+    return h.hexdigest()
+
+class SpectralStore:
+    """
+    Persistent cache of eigensolver results.
+    root defaults to $SPECTRAL_CACHE_DIR (or ~/.cache/science-scripture/spectra);
+    SPECTRAL_CACHE=0 disables reads and writes.
+    """
+    def __init__(self, root=None, enabled=None):
+        self.root = root or os.environ.get("SPECTRAL_CACHE_DIR", DEFAULT_ROOT)
+        if enabled is None:
+            enabled = os.environ.get("SPECTRAL_CACHE", "1") != "0"
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, model, L, params, kind, boundary='periodic', dtype='float64'):
+        desc = {
+            'version': STORE_VERSION,
+            'model': model,
+            'L': int(L),
+            'params': params,
+            'boundary': boundary,
+            'dtype': str(np.dtype(dtype)),
+            'kind': kind,
+        }
+        blob = json.dumps(desc, sort_keys=True, default=repr)
+        return hashlib.sha256(blob.encode()).hexdigest(), desc
+
+    def _path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+
+    def load(self, digest):
+        """
+        Returns {name: memmapped array} or None. Stale or corrupt entries are removed.
+        """
+        if not self.enabled:
+            return None
+        path = self._path(digest)
+        meta_file = os.path.join(path, "meta.json")
+        if not os.path.isfile(meta_file):
+            return None
+        try:
+            with open(meta_file) as f:
+                meta = json.load(f)
+            if meta.get('version') != STORE_VERSION or meta.get('digest') != digest:
+                raise ValueError("stale entry")
+            return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r')
+                    for name in meta['arrays']}
+        except (OSError, ValueError, KeyError):
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+
+    def save(self, digest, desc, **arrays):
+        if not self.enabled:
+            return
+        path = self._path(digest)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write into a sibling temp dir, then rename: readers never see partial entries
+            tmp = tempfile.mkdtemp(dir=os.path.dirname(path), prefix=".tmp-")
+        except OSError:
+            return
+        try:
+            for name, arr in arrays.items():
+                np.save(os.path.join(tmp, f"{name}.npy"), np.asarray(arr))
+            meta = dict(desc, digest=digest, arrays=sorted(arrays))
+            with open(os.path.join(tmp, "meta.json"), "w") as f:
+                json.dump(meta, f, sort_keys=True, indent=1, default=repr)
+            os.replace(tmp, path)
+        except OSError:
+            # Another process won the race (or the disk is read-only): keep theirs
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def fetch(self, model, L, params, kind, compute, boundary='periodic', dtype='float64'):
+        """
+        Load the entry or run compute() -> {name: array}, persist it and return it.
+        """
+        digest, desc = self.key(model, L, params, kind, boundary, dtype)
+        entry = self.load(digest)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        arrays = compute()
+        self.save(digest, desc, **arrays)
+        return arrays
+
+    def ground_state(self, model, L, params, solver, **kw):
+        """
+        solver() -> (E0, psi). Returns (E0, psi reshaped to (2,)*L).
+        """
+        def compute():
+            E0, psi = solver()
+            return {'eigvals': np.atleast_1d(E0), 'eigvecs': np.asarray(psi).reshape(-1)}
+        entry = self.fetch(model, L, params, 'ground', compute, **kw)
+        return float(entry['eigvals'][0]), entry['eigvecs'].reshape(*(2 for _ in range(L)))
+
+    def spectrum(self, model, L, params, solver, **kw):
+        """
+        solver() -> (w, v) full eigendecomposition.
+        """
+        def compute():
+            w, v = solver()
+            return {'eigvals': w, 'eigvecs': v}
+        entry = self.fetch(model, L, params, 'spectrum', compute, **kw)
+        return entry['eigvals'], entry['eigvecs']
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+class ByteBudgetCache:
+    """
+    In-process LRU cache bounded by total array bytes (drop-in for the old GLOBAL_CACHE dict).
+    Values are arrays, tuples/lists/dicts of them, or objects exposing nbytes; objects are
+    re-charged on every hit, so ones that grow after insertion stay inside the budget.
+    Evicted arrays are dropped, or written to spill_dir and memory-mapped back on demand.
+    Counters: hits (memory), spill_hits (disk), misses, evictions.
+    """
+    def __init__(self, budget_bytes=None, spill_dir=None):
+        if budget_bytes is None:
+            budget_bytes = int(os.environ.get("GLOBAL_CACHE_BYTES", 1 << 30))
+        self.budget_bytes = budget_bytes
+        self.spill_dir = spill_dir
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._spilled = {}
+        self._files = {} # key -> spill file on disk, spilled or mapped back into memory
+        self.nbytes = 0
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _size(value):
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (tuple, list)):
+            return sum(ByteBudgetCache._size(v) for v in value)
+        if isinstance(value, dict):
+            return sum(ByteBudgetCache._size(v) for v in value.values())
+        if hasattr(value, 'nbytes'):
+            return int(value.nbytes)
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+            return sys.getsizeof(value)
+        raise TypeError(f"Cannot budget a {type(value).__name__}: cache arrays, containers of arrays, or objects with nbytes")
+
+    def _charge(self, key):
+        # Re-measure one entry (objects such as engines may have grown since insertion)
+        size = self._size(self._entries[key])
+        self.nbytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+    def _spill_path(self, key):
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.spill_dir, f"{name}.npy")
+
+    @staticmethod
+    def _maps(value, path):
+        return (path is not None and isinstance(value, np.memmap)
+                and os.path.abspath(str(value.filename)) == os.path.abspath(path))
+
+    def _drop_file(self, key):
+        self._spilled.pop(key, None)
+        path = self._files.pop(key, None)
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _evict(self):
+        while self.nbytes > self.budget_bytes and self._entries:
+            key, value = self._entries.popitem(last=False)
+            self.nbytes -= self._sizes.pop(key)
+            self.evictions += 1
+            if self.spill_dir is not None and isinstance(value, np.ndarray):
+                path = self._spill_path(key)
+                # A value mapped back from its own spill file is already on disk;
+                # rewriting it would truncate the live mapping.
+                if not self._maps(value, path):
+                    os.makedirs(self.spill_dir, exist_ok=True)
+                    np.save(path, value)
+                self._spilled[key] = self._files[key] = path
+
+    def __contains__(self, key):
+        return key in self._entries or key in self._spilled
+
+    def __len__(self):
+        return len(self._entries) + len(self._spilled)
+
+    def __getitem__(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = self._entries[key]
+            if not isinstance(value, np.ndarray):
+                self._charge(key)
+                self._evict()
+            return value
+        if key in self._spilled:
+            self.spill_hits += 1
+            value = np.load(self._spilled[key], mmap_mode='r')
+            self[key] = value # keeps the file: it backs the mapping
+            return value
+        self.misses += 1
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        size = self._size(value)
+        if key in self._entries:
+            del self._entries[key]
+            self.nbytes -= self._sizes.pop(key)
+        if self._maps(value, self._files.get(key)):
+            self._spilled.pop(key, None)
+        else:
+            self._drop_file(key) # stale spill of an overwritten value
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.nbytes += size
+        self._evict()
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def get_or_compute(self, key, compute):
+        try:
+            return self[key]
+        except KeyError:
+            value = compute()
+            self[key] = value
+            return value
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        for key in list(self._files):
+            self._drop_file(key)
+        self._spilled.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        return {'entries': len(self._entries), 'spilled': len(self._spilled), 'nbytes': self.nbytes,
+                'hits': self.hits, 'spill_hits': self.spill_hits, 'misses': self.misses, 'evictions': self.evictions}
@@ -0,0 +1,59 @@
+import numpy as np
+
+"""
+spectral_propagator.py — Phases 6/7/9 Support: Eigenbasis Evolution of State Stacks
+Given H = V diag(w) V^†, K initial states and T times,
+    Ψ(t_j) = V (e^{-i t_j w} ⊙ C),   C = V^† Ψ(0),
+is evaluated for a whole chunk of times as ONE GEMM: V @ [dim x (T_chunk * K)].
+Same iter_evolve / evolve interface as KrylovPropagator.
+"""
+
+class SpectralPropagator:
+    """
+    Multi-state, multi-time evolution from a full eigendecomposition (w, v).
+    chunk: times per GEMM; None sizes chunks so the stacked block stays under max_bytes.
+    """
+    def __init__(self, w, v, chunk=None, max_bytes=256 * 2**20):
+        self.w = np.asarray(w)
+        self.v = np.asarray(v)
+        self.dim = self.v.shape[0]
+        self.chunk = chunk
+        self.max_bytes = max_bytes
+
+    def coefficients(self, states):
+        """
+        C = V^† Ψ(0) for a list of state tensors or a (dim, K) array.
+        """
+        if isinstance(states, np.ndarray) and states.ndim == 2 and states.shape[0] == self.dim:
+            block = states
+        else:
+            block = np.column_stack([np.asarray(s).reshape(-1) for s in states])
+        return self.v.conj().T @ block
+
+    def _chunk_size(self, n_states):
+        if self.chunk is not None:
+            return self.chunk
+        # Phase-weighted stack and GEMM output, complex128 each
+        return max(1, int(self.max_bytes // (2 * 16 * self.dim * n_states)))
+
+    def iter_evolve(self, states, times):
+        """
+        Yields (t, block(t)) with block of shape (dim, K); one GEMM per chunk of times.
+        """
+        C = self.coefficients(states)
+        K = C.shape[1]
+        times = np.asarray(times, dtype=float)
+        size = self._chunk_size(K)
+        for start in range(0, len(times), size):
+            ts = times[start:start + size]
+            phases = np.exp(-1j * np.outer(self.w, ts))                     # dim x T
+            stacked = (phases[:, :, None] * C[:, None, :]).reshape(self.dim, -1)
+            out = (self.v @ stacked).reshape(self.dim, len(ts), K)
+            for j, t in enumerate(ts):
+                yield t, out[:, j, :]
+
+    def evolve(self, states, times):
+        """
+        Array (T, dim, K) of evolved states.
+        """
+        return np.array([block for _, block in self.iter_evolve(states, times)])
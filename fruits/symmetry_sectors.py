@@ -0,0 +1,388 @@
+import numpy as np
+from functools import lru_cache
+from scipy.sparse import coo_matrix, csr_matrix, diags
+from scipy.sparse.linalg import eigsh
+from pauli_chain import PAULI_PHASE, chain_terms
+
+"""
+symmetry_sectors.py — Phase 8 Support: Z2-Parity x Translation Block Diagonalization
+Periodic chains commuting with the global flip P = prod_i X_i and the lattice shift T.
+Sector (k, p): T^r P^f acts as exp(-2πi k r / L) * p^f.
+Each block has dimension ~2^L / 2L, so dense eigh per block is ~(2L)^2 cheaper overall.
+S^z-conserving models (XXZ) additionally split into fixed-magnetization sectors.
+resolved_spectra splits any periodic chain as far as its symmetries allow (level statistics).
+"""
+
+def _rotate(states, r, L):
+    mask = (1 << L) - 1
+    r %= L
+    if r == 0:
+        return states.copy()
+    return ((states << r) | (states >> (L - r))) & mask
+
+def _group_action(states, r, f, L):
+    # T^r P^f |s>: flip all bits (f=1), then rotate by r
+    mask = (1 << L) - 1
+    return _rotate(states ^ (mask * f), r, L)
+
+@lru_cache(maxsize=8)
+def _orbit_table(L):
+    """
+    For every basis state s: its orbit representative (smallest integer) and the
+    group element h = (r, f) with h s = rep. Shared by all sectors of a given L.
+    """
+    states = np.arange(2**L, dtype=np.int64)
+    rep = states.copy()
+    r_of = np.zeros(2**L, dtype=np.int64)
+    f_of = np.zeros(2**L, dtype=np.int64)
+    for f in (0, 1):
+        for r in range(L):
+            img = _group_action(states, r, f, L)
+            better = img < rep
+            rep[better] = img[better]
+            r_of[better] = r
+            f_of[better] = f
+    return rep, r_of, f_of
+
+class SymmetrySector:
+    """
+    Symmetry-adapted basis of one (k, p) block: orbit representatives and their
+    stabilizer sums N_s = Σ_{g s = s} χ(g)*. Representatives with N_s = 0 are
+    annihilated by the sector projector and dropped.
+    """
+    def __init__(self, L, k, parity=1):
+        assert parity in (1, -1), "parity must be +1 or -1"
+        self.L = L
+        self.k = k % L
+        self.parity = parity
+        self.group_size = 2 * L
+        # Characters are real for k = 0 and k = π
+        self.is_real = (2 * self.k) % L == 0
+
+        rep_of, _, _ = _orbit_table(L)
+        reps = np.flatnonzero(rep_of == np.arange(2**L))
+        norms = np.zeros(len(reps), dtype=complex)
+        for f in (0, 1):
+            for r in range(L):
+                fixed = _group_action(reps, r, f, L) == reps
+                norms[fixed] += np.conj(self.character(r, f))
+        keep = np.abs(norms) > 1e-9
+        self.reps = reps[keep]
+        self.norms = np.real(norms[keep])
+
+    @property
+    def dim(self):
+        return len(self.reps)
+
+    def character(self, r, f):
+        return np.exp(-2j * np.pi * self.k * r / self.L) * self.parity**f
+
+    def locate(self, states):
+        """
+        Map basis states to (block index, χ(g)) with states = g rep.
+        Block index is -1 for states whose orbit is absent from this sector.
+        """
+        rep_of, r_of, f_of = _orbit_table(self.L)
+        reps = rep_of[states]
+        pos = np.searchsorted(self.reps, reps)
+        pos_c = np.minimum(pos, self.dim - 1)
+        found = self.reps[pos_c] == reps
+        # g = h^{-1} = (-r, f) where h s = rep
+        chars = self.character(-r_of[states], f_of[states])
+        return np.where(found, pos_c, -1), chars
+
+    def embed(self, vecs):
+        """
+        Scatter block eigenvectors back to the full 2^L basis.
+        A single vector is returned in the (2,)*L tensor shape used by compute_entropy.
+        """
+        single = vecs.ndim == 1
+        coeffs = vecs.reshape(self.dim, -1)
+        full = np.zeros((2**self.L, coeffs.shape[1]), dtype=complex)
+        for f in (0, 1):
+            for r in range(self.L):
+                img = _group_action(self.reps, r, f, self.L)
+                weight = np.conj(self.character(r, f)) / np.sqrt(self.group_size * self.norms)
+                np.add.at(full, img, weight[:, None] * coeffs)
+        if self.is_real and not np.iscomplexobj(vecs):
+            full = np.real(full)
+        if single:
+            return full[:, 0].reshape(*(2 for _ in range(self.L)))
+        return full
+
+def _check_parity_invariant(terms):
+    for coeff, ops in terms:
+        odd = sum(1 for _, p in ops if p != 'X') % 2
+        if odd and coeff != 0:
+            raise ValueError("Hamiltonian breaks Z2 spin-flip parity (odd Y/Z string present)")
+
+def build_sector_hamiltonian(sector, terms):
+    """
+    Block of a translation-invariant, parity-even Pauli-chain Hamiltonian in one sector:
+    <r|H|s> = Σ_j h_j χ(g_j) sqrt(N_r / N_s), where H|s> = Σ_j h_j g_j|r_j>.
+    """
+    _check_parity_invariant(terms)
+    L = sector.L
+    reps = sector.reps
+    dim = sector.dim
+    diag = np.zeros(dim)
+    rows, cols, vals = [], [], []
+    for coeff, ops in terms:
+        mask = 0
+        for site, p in ops:
+            if p != 'Z':
+                mask |= 1 << (L - 1 - site)
+        out = reps ^ mask
+        amp = np.full(dim, coeff, dtype=complex)
+        for site, p in ops:
+            amp *= PAULI_PHASE[p][(out >> (L - 1 - site)) & 1]
+        if mask == 0:
+            diag += np.real(amp)
+            continue
+        idx, chars = sector.locate(out)
+        valid = idx >= 0
+        src = np.flatnonzero(valid)
+        dst = idx[valid]
+        rows.append(dst)
+        cols.append(src)
+        vals.append(amp[valid] * chars[valid] * np.sqrt(sector.norms[dst] / sector.norms[src]))
+    rows.append(np.arange(dim))
+    cols.append(np.arange(dim))
+    vals.append(diag.astype(complex))
+    H = coo_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))), shape=(dim, dim)).tocsr()
+    if sector.is_real:
+        H = H.real
+    return H
+
+def symmetric_eigh(model_type, L, **params):
+    """
+    Dense eigh of every (k, p) block of a symmetric HamiltonianFactory model.
+    Returns a list of (sector, eigvals, eigvecs) in sector coordinates.
+    """
+    terms = chain_terms(model_type, L, **params)
+    blocks = []
+    for parity in (1, -1):
+        for k in range(L):
+            sector = SymmetrySector(L, k, parity)
+            if sector.dim == 0: continue
+            H_blk = build_sector_hamiltonian(sector, terms)
+            w, v = np.linalg.eigh(H_blk.toarray())
+            blocks.append((sector, w, v))
+    return blocks
+
+def symmetric_ground_state(model_type, L, **params):
+    """
+    Lowest block eigenpair, embedded in the full (2,)*L tensor. Returns (E0, state, (k, p)).
+    """
+    terms = chain_terms(model_type, L, **params)
+    best = None
+    for parity in (1, -1):
+        for k in range(L):
+            sector = SymmetrySector(L, k, parity)
+            if sector.dim == 0: continue
+            H_blk = build_sector_hamiltonian(sector, terms)
+            w, v = np.linalg.eigh(H_blk.toarray())
+            if best is None or w[0] < best[0] - 1e-12:
+                best = (w[0], sector, v[:, 0])
+    E0, sector, vec = best
+    return E0, sector.embed(vec), (sector.k, sector.parity)
+
+def symmetric_full_eigh(model_type, L, **params):
+    """
+    Full spectrum and eigenbasis assembled from the blocks (ascending energy).
+    Drop-in replacement for np.linalg.eigh(H.toarray()) on symmetric models.
+    """
+    ws, vs = [], []
+    for sector, w, v in symmetric_eigh(model_type, L, **params):
+        ws.append(w)
+        vs.append(sector.embed(v))
+    w = np.concatenate(ws)
+    order = np.argsort(w, kind='stable')
+    V = np.concatenate(vs, axis=1)[:, order]
+    if not np.iscomplexobj(V) or np.all(np.abs(np.imag(V)) == 0):
+        V = np.real(V)
+    return w[order], V
+
+@lru_cache(maxsize=8)
+def _binomial_table(L):
+    C = np.zeros((L + 1, L + 2), dtype=np.int64)
+    for n in range(L + 1):
+        C[n, 0] = 1
+        for j in range(1, n + 1):
+            C[n, j] = C[n - 1, j - 1] + C[n - 1, j]
+    return C
+
+class MagnetizationSector:
+    """
+    Fixed-S^z basis: all L-bit strings with n_up set bits, in increasing integer order.
+    Ranking uses the combinatorial number system, rank(s) = Σ_j C(b_j, j+1) over the
+    set-bit positions b_0 < b_1 < ..., which coincides with the sorted order.
+    """
+    def __init__(self, L, n_up):
+        assert 0 <= n_up <= L, "n_up must lie in [0, L]"
+        self.L = L
+        self.n_up = n_up
+        self.binom = _binomial_table(L)
+        self.dim = int(self.binom[L, n_up])
+        self.states = self.unrank(np.arange(self.dim, dtype=np.int64))
+
+    def rank(self, states):
+        states = np.asarray(states, dtype=np.int64)
+        r = np.zeros(states.shape, dtype=np.int64)
+        count = np.zeros(states.shape, dtype=np.int64)
+        for b in range(self.L):
+            bit = (states >> b) & 1
+            r += bit * self.binom[b, np.minimum(count + 1, self.L)]
+            count += bit
+        return r
+
+    def unrank(self, ranks):
+        r = np.array(ranks, dtype=np.int64)
+        remaining = np.full(r.shape, self.n_up, dtype=np.int64)
+        states = np.zeros(r.shape, dtype=np.int64)
+        for b in range(self.L - 1, -1, -1):
+            c = self.binom[b, remaining]
+            take = (remaining > 0) & (c <= r)
+            states |= take.astype(np.int64) << b
+            r -= np.where(take, c, 0)
+            remaining -= take
+        return states
+
+    def embed(self, vec):
+        """
+        Scatter a sector vector into the full (2,)*L tensor used by compute_entropy.
+        """
+        full = np.zeros(2**self.L, dtype=vec.dtype)
+        full[self.states] = vec
+        return full.reshape(*(2 for _ in range(self.L)))
+
+def build_magnetization_hamiltonian(sector, terms):
+    """
+    Block of an S^z-conserving Pauli-chain Hamiltonian (e.g. XXZ) in one magnetization sector.
+    Strings are merged per flip mask first, so XX and YY only need to conserve S^z jointly.
+    """
+    L = sector.L
+    states = sector.states
+    dim = sector.dim
+    diag = np.zeros(dim)
+    groups = {}
+    for coeff, ops in terms:
+        mask = 0
+        for site, p in ops:
+            if p != 'Z':
+                mask |= 1 << (L - 1 - site)
+        out = states ^ mask
+        amp = np.full(dim, coeff, dtype=complex)
+        for site, p in ops:
+            amp *= PAULI_PHASE[p][(out >> (L - 1 - site)) & 1]
+        if mask == 0:
+            diag += np.real(amp)
+        elif mask in groups:
+            groups[mask] += amp
+        else:
+            groups[mask] = amp
+    
+    rows, cols, vals = [np.arange(dim)], [np.arange(dim)], [diag.astype(complex)]
+    for mask, amp in groups.items():
+        nz = np.flatnonzero(np.abs(amp) > 1e-14)
+        out = states[nz] ^ mask
+        n_out = sum((out >> b) & 1 for b in range(L))
+        if np.any(n_out != sector.n_up):
+            raise ValueError("Hamiltonian does not conserve total S^z")
+        rows.append(sector.rank(out))
+        cols.append(nz)
+        vals.append(amp[nz])
+    H = coo_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))), shape=(dim, dim)).tocsr()
+    if np.all(np.imag(H.data) == 0):
+        H = H.real
+    return H
+
+def magnetization_ground_state(model_type, L, dense_max_dim=2000, **params):
+    """
+    Ground state over all S^z sectors (n_up <= L/2 suffices: the global flip maps n to L-n).
+    Small blocks use dense eigh, larger ones sparse eigsh.
+    Returns (E0, state tensor, n_up).
+    """
+    terms = chain_terms(model_type, L, **params)
+    best = None
+    for n_up in range(L // 2 + 1):
+        sector = MagnetizationSector(L, n_up)
+        H_blk = build_magnetization_hamiltonian(sector, terms)
+        if sector.dim <= dense_max_dim:
+            w, v = np.linalg.eigh(H_blk.toarray())
+        else:
+            w, v = eigsh(H_blk, k=1, which='SA')
+        if best is None or w[0] < best[0] - 1e-12:
+            best = (w[0], sector, v[:, 0])
+    E0, sector, vec = best
+    return E0, sector.embed(vec), sector.n_up
+
+def symmetry_blocks(ops, dim, tol=1e-8):
+    """
+    Isometries (dim, d_g) onto the joint eigenspaces of commuting Hermitian ops, applied in
+    turn; an op that does not map a block into itself leaves that block unsplit.
+    """
+    blocks = [np.eye(dim)]
+    for op in ops:
+        split = []
+        for U in blocks:
+            O = U.conj().T @ op @ U
+            if np.max(np.abs(op @ U - U @ O), initial=0.0) > tol:
+                split.append(U)
+                continue
+            w, V = np.linalg.eigh((O + O.conj().T) / 2)
+            labels = np.round(w / tol) * tol
+            for value in np.unique(labels):
+                split.append(U @ V[:, labels == value])
+        blocks = split
+    return blocks
+
+def _bit_reverse(states, L):
+    out = np.zeros_like(states)
+    for b in range(L):
+        out |= ((states >> b) & 1) << (L - 1 - b)
+    return out
+
+def resolved_spectra(H, L, tol=1e-10):
+    """
+    Yields (label, eigvals) for every fully resolved block of a translation-invariant chain
+    H (sparse, periodic): fixed S^z when H conserves it (MagnetizationSector), momentum
+    k <= L/2 (k and -k are degenerate), then spin flip and reflection wherever they map a
+    block to itself (flip at S^z = 0 only, reflection at k = 0, L/2 only).
+    Momentum bases are sparse: one column per orbit representative, L entries each.
+    """
+    dim = 2**L
+    states = np.arange(dim, dtype=np.int64)
+    H = csr_matrix(H)
+    rows, cols = H.nonzero()
+    popcount = np.bitwise_count(states).astype(np.int64)
+    conserves_sz = np.all(popcount[rows] == popcount[cols])
+    perms = []
+    for perm in (states ^ (dim - 1), _bit_reverse(states, L)):
+        if abs(H[perm][:, perm] - H).max() < tol:
+            perms.append(perm)
+    subsets = [(n, MagnetizationSector(L, n).states) for n in range(L + 1)] if conserves_sz else [(None, states)]
+    mask = dim - 1
+    for n_up, subset in subsets:
+        rots = np.array([((subset << r) | (subset >> (L - r))) & mask for r in range(L)])
+        is_rep = rots.min(axis=0) == subset
+        orbits = rots[:, is_rep]
+        n_reps = orbits.shape[1]
+        for k in range(L // 2 + 1):
+            phases = np.exp(2j * np.pi * k * np.arange(L) / L)
+            B = coo_matrix((np.repeat(phases, n_reps), (orbits.ravel(), np.tile(np.arange(n_reps), L))),
+                           shape=(dim, n_reps)).tocsc()
+            norms = np.sqrt(np.asarray(abs(B).power(2).sum(axis=0)).ravel())
+            keep = norms > 1e-9
+            if not np.any(keep): continue
+            B = B[:, keep] @ diags(1.0 / norms[keep])
+            Bh = B.conj().T.tocsr()
+            H_k = (Bh @ (H @ B)).toarray()
+            ops = []
+            for perm in perms:
+                O = (Bh @ B[perm]).toarray()
+                # Unitary only if the symmetry maps this block into itself
+                if np.allclose(O @ O.conj().T, np.eye(len(O)), atol=1e-8):
+                    ops.append(O)
+            for g, U in enumerate(symmetry_blocks(ops, len(H_k))):
+                yield (n_up, k, g), np.linalg.eigvalsh(U.conj().T @ H_k @ U)
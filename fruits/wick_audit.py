@@ -0,0 +1,143 @@
+import numpy as np
+from itertools import combinations
+from math import comb
+
+"""
+wick_audit.py — Audit Support: Matrix-Free Wick/Pfaffian Certification of Gaussianity
+Majoranas (X-string Jordan-Wigner, as free_fermion.py) are Pauli strings phase * X^x Z^z on
+basis-index bits (site 0 = most significant bit):
+    γ_{2j} = X_{<j} Z_j,   γ_{2j+1} = X_{<j} Y_j = i X_{≤j} Z_j,
+    (X^x Z^z ψ)[y] = (-1)^{|(y ^ x) & z|} ψ[y ^ x].
+So <γ_a γ_b> and any product of Majoranas are read off ψ with index flips and parity signs.
+A pure state is Gaussian iff Γ^T Γ = 1 (Γ_ab = (i/2)<[γ_a, γ_b]>); the explicit Wick
+identities <γ_{a1} ... γ_{a2k}> = Pf(G[a, a]) are checked on top for k = 2 (and 3).
+"""
+
+def _parity(v):
+    # bitwise_count is uint8; widen before forming signs
+    return (np.bitwise_count(v) & 1).astype(np.int64)
+
+def majorana_masks(L):
+    """
+    (xmask, zmask, phase) of γ_0 .. γ_{2L-1}.
+    """
+    bit = 1 << (L - 1 - np.arange(L))
+    below = np.concatenate([[0], np.cumsum(bit)[:-1]])
+    x = np.empty(2 * L, dtype=np.int64)
+    z = np.empty(2 * L, dtype=np.int64)
+    x[0::2], x[1::2] = below, below | bit
+    z[0::2], z[1::2] = bit, bit
+    phase = np.tile([1.0, 1j], L)
+    return x, z, phase
+
+def string_product(strings):
+    """
+    Product of Pauli strings given as arrays (x, z, phase) stacked on the last axis of
+    each; (X^x1 Z^z1)(X^x2 Z^z2) = (-1)^{|z1 & x2|} X^{x1^x2} Z^{z1^z2}.
+    """
+    x, z, phase = strings[0]
+    for x2, z2, p2 in strings[1:]:
+        phase = phase * p2 * (1 - 2 * _parity(z & x2))
+        x, z = x ^ x2, z ^ z2
+    return x, z, phase
+
+def pfaffian(A):
+    """
+    Pfaffian of antisymmetric (..., 2k, 2k) blocks, by expansion along the first row.
+    """
+    n = A.shape[-1]
+    if n == 0:
+        return np.ones(A.shape[:-2], dtype=A.dtype)
+    total = 0.0
+    for j in range(1, n):
+        rest = [k for k in range(1, n) if k != j]
+        sub = A[..., rest, :][..., :, rest]
+        total = total + (-1) ** (j + 1) * A[..., 0, j] * pfaffian(sub)
+    return total
+
+class WickAuditor:
+    """
+    Gaussianity audit of a (2,)*L state vector; chunk caps the (basis rows x strings) block.
+    """
+    def __init__(self, state, chunk=1 << 22):
+        self.psi = np.asarray(state).reshape(-1).astype(complex)
+        self.L = int(np.round(np.log2(self.psi.size)))
+        self.chunk = chunk
+        self.x, self.z, self.phase = majorana_masks(self.L)
+        self._G = None
+
+    def expectations(self, x, z, phase):
+        """
+        <ψ| phase X^x Z^z |ψ> for arrays of strings, one pass over ψ.
+        """
+        out = np.zeros(len(x), dtype=complex)
+        # chunk bounds the (rows x strings) work array
+        rows = max(1, min(self.psi.size, self.chunk // max(1, len(x))))
+        cols = max(1, self.chunk // rows)
+        for s0 in range(0, len(x), cols):
+            xs, zs = x[s0:s0 + cols], z[s0:s0 + cols]
+            for start in range(0, self.psi.size, rows):
+                y = np.arange(start, min(start + rows, self.psi.size))
+                flipped = y[:, None] ^ xs
+                signs = 1 - 2 * _parity(flipped & zs)
+                out[s0:s0 + cols] += self.psi[y].conj() @ (signs * self.psi[flipped])
+        return phase * out
+
+    def two_point(self):
+        """
+        G_ab = <γ_a γ_b> for all 2L x 2L pairs.
+        """
+        if self._G is None:
+            m = 2 * self.L
+            a, b = np.triu_indices(m, 1)
+            G = np.eye(m, dtype=complex)
+            G[a, b] = self.expectations(*string_product([(self.x[a], self.z[a], self.phase[a]),
+                                                          (self.x[b], self.z[b], self.phase[b])]))
+            G[b, a] = -G[a, b]
+            self._G = G
+        return self._G
+
+    @property
+    def Gamma(self):
+        # Γ_ab = i <γ_a γ_b> for a != b (real antisymmetric)
+        return np.real(1j * (self.two_point() - np.eye(2 * self.L)))
+
+    def purity_defect(self):
+        """
+        max |Γ^T Γ - 1|: zero iff the pure state is Gaussian.
+        """
+        Gamma = self.Gamma
+        return np.max(np.abs(Gamma.T @ Gamma - np.eye(2 * self.L)))
+
+    def wick_residuals(self, order=4, n_samples=None, seed=0):
+        """
+        |<γ_{a1} ... γ_{a_order}> - Pf(G[a, a])| over ordered index tuples a1 < ... < a_order:
+        all of them, or n_samples distinct ones drawn with a private Generator(seed) without
+        enumerating the C(2L, order) tuples.
+        """
+        m = 2 * self.L
+        if n_samples is None or n_samples >= comb(m, order):
+            tuples = np.array(list(combinations(range(m), order)))
+        else:
+            rng = np.random.default_rng(seed)
+            drawn = set()
+            while len(drawn) < n_samples:
+                drawn.add(tuple(np.sort(rng.choice(m, order, replace=False)).tolist()))
+            tuples = np.array(sorted(drawn))
+        strings = [(self.x[tuples[:, k]], self.z[tuples[:, k]], self.phase[tuples[:, k]]) for k in range(order)]
+        values = self.expectations(*string_product(strings))
+        G = self.two_point()
+        # Off-diagonal G is antisymmetric, so Pf(G[a, a]) is the Wick sum with signs
+        blocks = G[tuples[:, :, None], tuples[:, None, :]]
+        blocks = blocks - np.eye(order) * blocks
+        return np.abs(values - pfaffian(blocks)), tuples
+
+    def audit(self, orders=(4,), n_samples=None, seed=0):
+        """
+        {'purity': ..., 'wick_4': max residual, ...}.
+        """
+        report = {'purity': self.purity_defect()}
+        for order in orders:
+            res, _ = self.wick_residuals(order, n_samples, seed)
+            report[f'wick_{order}'] = res.max()
+        return report
@@ -0,0 +1,85 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from scipy.ndimage import label
+
+"""
+window_scan.py — Phase 10 Support: Parallel (l, ε, t) Semiclassical-Window Grid
+A cell (l, ε, t) is admissible when
+    χ_rel(l, ε, t) < chi_tol   and   κ4(l) < kappa_floor  or  κ4(l) <= γ κ4(l=2),
+with χ_rel the additivity error of the ε-deformed states quenched to time t and κ4 a
+ground-state property (one value per l), per entry as in compute_cumulant_norm. The floor
+marks numerically Gaussian blocks; the relative test only applies once the l=2 baseline
+is itself above the floor (otherwise it compares roundoff). W is the boolean grid; its connected components
+(face-adjacent cells) show whether W is one window, fragmented, or empty.
+"""
+
+def scan_map(fn, tasks, workers=None):
+    """
+    [fn(task) for task in tasks] fanned out over a process pool. fn must be picklable
+    (module level). Falls back to a serial loop on one core or when no pool can start.
+    """
+    tasks = list(tasks)
+    workers = min(len(tasks), workers or os.cpu_count() or 1)
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(fn, tasks))
+        except (OSError, BrokenProcessPool):
+            pass # e.g. no POSIX semaphores in a sandbox
+    return [fn(task) for task in tasks]
+
+class WindowGrid:
+    """
+    Scores and admissibility of the (l, ε, t) grid.
+    score: χ_rel array of shape (n_l, n_eps, n_t); kappa: κ4 per l.
+    """
+    def __init__(self, scales, epsilons, times, score, kappa, kappa_baseline,
+                 chi_tol=0.05, gamma=0.85, kappa_floor=1e-3):
+        self.scales = np.asarray(scales)
+        self.epsilons = np.asarray(epsilons, dtype=float)
+        self.times = np.asarray(times, dtype=float)
+        self.score = np.asarray(score, dtype=float)
+        self.kappa = np.asarray(kappa, dtype=float)
+        self.kappa_baseline = kappa_baseline
+        self.chi_tol = chi_tol
+        self.gamma = gamma
+        self.kappa_floor = kappa_floor
+
+    @property
+    def suppressed(self):
+        # Absolutely small, or IR suppression of κ4 relative to a non-Gaussian l=2 baseline
+        relative = (self.kappa_baseline >= self.kappa_floor) & (self.kappa <= self.kappa_baseline * self.gamma)
+        return (self.kappa < self.kappa_floor) | relative
+
+    @property
+    def mask(self):
+        return (self.score < self.chi_tol) & self.suppressed[:, None, None]
+
+    def components(self):
+        """
+        Connected components of W, largest first: list of (n_cells, 3) index arrays.
+        """
+        labels, n = label(self.mask)
+        comps = [np.argwhere(labels == i + 1) for i in range(n)]
+        return sorted(comps, key=len, reverse=True)
+
+    def cells(self, component):
+        """
+        (l, ε, t) values of a component's index array.
+        """
+        i, j, k = component.T
+        return list(zip(self.scales[i].tolist(), self.epsilons[j].tolist(), self.times[k].tolist()))
+
+    def admissible_scales(self, eps_index=0, t_index=0):
+        return self.scales[self.mask[:, eps_index, t_index]].tolist()
+
+    def save(self, path):
+        """
+        Compact .npz: axes, χ_rel scores, κ4 per l, W mask and component labels.
+        """
+        labels, _ = label(self.mask)
+        np.savez_compressed(path, scales=self.scales, epsilons=self.epsilons, times=self.times,
+                            score=self.score, kappa=self.kappa, kappa_baseline=self.kappa_baseline,
+                            mask=self.mask, labels=labels.astype(np.int16))